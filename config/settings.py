@@ -54,6 +54,36 @@ class TimeoutConfig:
     API_REQUEST: int = 30000  # For API calls
 
 
+@dataclass(frozen=True)
+class HTTPPoolConfig:
+    """Connection pool & retry configuration for the API client's Session."""
+    # Số host được giữ pool (API + CDN/upload...)
+    POOL_CONNECTIONS: int = field(
+        default_factory=lambda: int(os.getenv("API_POOL_CONNECTIONS", "32"))
+    )
+    # Số connection keep-alive mỗi host (>= số thread gửi song song)
+    POOL_MAXSIZE: int = field(
+        default_factory=lambda: int(os.getenv("API_POOL_MAXSIZE", "64"))
+    )
+    # "requests" (HTTP/1.1 keep-alive) hoặc "httpx-h2" (HTTP/2 multiplexing, cần httpx[http2])
+    BACKEND: str = field(
+        default_factory=lambda: os.getenv("API_BACKEND", "requests").lower()
+    )
+    RETRY_TOTAL: int = 3
+    RETRY_BACKOFF: float = 0.2
+    RETRY_STATUSES: tuple = (502, 503, 504)
+
+
+@dataclass(frozen=True)
+class APILogConfig:
+    """API client logging configuration."""
+    # Ghi request/response body (đã mask) ở level DEBUG. Logger luôn ở DEBUG nên
+    # cần flag riêng: tắt thì response không bị parse/mask chỉ để log
+    LOG_BODIES: bool = field(
+        default_factory=lambda: os.getenv("LOG_API_BODIES", "false").lower() == "true"
+    )
+
+
 @dataclass(frozen=True)
 class BrowserSettings:
     """Browser configurations."""
@@ -73,6 +103,15 @@ class BrowserSettings:
     RECORD_VIDEO: bool = field(
         default_factory=lambda: os.getenv("RECORD_VIDEO", "false").lower() == "true"
     )
+    # Ghi Playwright trace, chỉ lưu file khi test fail
+    RECORD_TRACE: bool = field(
+        default_factory=lambda: os.getenv("RECORD_TRACE", "false").lower() == "true"
+    )
+    # Cho phép chặn image/font/media + analytics ở các suite đánh dấu
+    # @pytest.mark.block_resources (profile, search); false = không chặn ở đâu cả
+    BLOCK_RESOURCES: bool = field(
+        default_factory=lambda: os.getenv("BLOCK_RESOURCES", "true").lower() == "true"
+    )
 
 @dataclass(frozen=True)
 class TestCredentials:
@@ -85,11 +124,24 @@ class TestCredentials:
         return bool(self.email and self.password)
 
 
+def _worker_env(name: str) -> str:
+    """
+    Đọc biến môi trường theo xdist worker: ưu tiên `<NAME>_GW0`, `<NAME>_GW1`...
+    (mỗi worker một account riêng), fallback về `<NAME>`.
+    """
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    if worker:
+        value = os.getenv(f"{name}_{worker.upper()}")
+        if value:
+            return value
+    return os.getenv(name, "")
+
+
 @dataclass(frozen=True)
 class ExistingUserCredentials:
     """Pre-existing test account credentials (for tests with existing data)."""
-    email: str = field(default_factory=lambda: os.getenv("EXISTING_USER_EMAIL", ""))
-    password: str = field(default_factory=lambda: os.getenv("EXISTING_USER_PASSWORD", ""))
+    email: str = field(default_factory=lambda: _worker_env("EXISTING_USER_EMAIL"))
+    password: str = field(default_factory=lambda: _worker_env("EXISTING_USER_PASSWORD"))
     
     @property
     def is_valid(self) -> bool:
@@ -115,6 +167,8 @@ class Settings:
         # Init configs
         self.urls = self._configure_urls()
         self.timeouts = TimeoutConfig()
+        self.http_pool = HTTPPoolConfig()
+        self.api_log = APILogConfig()
         self.browser = BrowserSettings()
         self.credentials = TestCredentials()
         self.existing_user_creds = ExistingUserCredentials()
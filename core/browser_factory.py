@@ -1,9 +1,36 @@
 from enum import Enum
-from playwright.sync_api import Browser, BrowserContext, Page
+from urllib.parse import urlsplit
+from playwright.sync_api import Browser, BrowserContext, Page, Route
 from core.logger import log
 from config.settings import settings
 
 logger = log()
+
+# Tài nguyên mà suite opt-in (profile, search) không assert -> abort để giảm bytes và thời gian load
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+# Host analytics bên thứ ba (so theo hostname, không theo substring của URL)
+BLOCKED_HOSTS = (
+    "google-analytics.com",
+    "analytics.google.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+)
+
+
+def _is_blocked_host(url: str) -> bool:
+    host = urlsplit(url).hostname or ""
+    return any(host == blocked or host.endswith("." + blocked) for blocked in BLOCKED_HOSTS)
+
+
+def _block_heavy_resources(route: Route):
+    """Abort images/fonts/media và analytics bên thứ ba, cho qua các request còn lại."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or _is_blocked_host(request.url):
+        route.abort()
+    else:
+        route.continue_()
+
+
 class BrowserType(Enum):
     CHROMIUM = "chromium"
     FIREFOX = "firefox"
@@ -11,11 +38,13 @@ class BrowserType(Enum):
 
 class BrowserFactory:
     @staticmethod
-    def create_context(browser: Browser, **kwargs) -> BrowserContext:
+    def create_context(browser: Browser, block_resources: bool = False, **kwargs) -> BrowserContext:
         """
         Tạo Browser Context với cấu hình chuẩn từ Settings.
         Args:
             browser: Instance browser đã được Pytest khởi tạo.
+            block_resources: Chặn image/font/media + analytics (chỉ cho suite
+                không assert các tài nguyên này, xem marker `block_resources`).
             **kwargs: Các override options nếu cần.
         """
         # 1. Lấy config mặc định từ settings.py
@@ -37,6 +66,10 @@ class BrowserFactory:
         # 4. Set default timeout
         context.set_default_timeout(settings.timeouts.DEFAULT)
         
+        # 5. Chặn tài nguyên nặng khi được yêu cầu (tắt hẳn bằng BLOCK_RESOURCES=false)
+        if block_resources and settings.browser.BLOCK_RESOURCES:
+            context.route("**/*", _block_heavy_resources)
+        
         return context
 
     @staticmethod
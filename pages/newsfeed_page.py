@@ -1,4 +1,4 @@
-from typing import List
+from typing import Any, Dict, List, Optional
 from playwright.sync_api import Page, Locator
 from core.base_page import BasePage
 from pages.locators.newsfeed_locators import NEWSFEED
@@ -16,12 +16,40 @@ class NewsfeedPage(BasePage):
         from config.settings import settings
         self.url = f"{settings.urls.base_ui}/"
     
+    @classmethod
+    def for_page(cls, page: Page) -> "NewsfeedPage":
+        """
+        Return the NewsfeedPage bound to `page`, creating it on first use.
+        
+        Cached on the Page object itself, so it lives and dies with the page
+        (a page -> page-object reference cycle the GC collects together).
+        """
+        instance = page.__dict__.get("_newsfeed_page")
+        if instance is None:
+            instance = page.__dict__.setdefault("_newsfeed_page", cls(page))
+        return instance
+    
     def open(self):
         """Navigate to newsfeed."""
         super().open(self.url)
         logger.info("📄 Opened Newsfeed Page")
         self.wait_for_posts_to_load()
     
+    def refresh(self):
+        """
+        Re-fetch newsfeed posts.
+        
+        Uses the SPA's `window.__refetch_posts` hook when the frontend exposes it
+        (single XHR, no bundle reload); falls back to a full page reload.
+        """
+        soft = self.page.evaluate(
+            "() => typeof window.__refetch_posts === 'function' && (window.__refetch_posts(), true)"
+        )
+        if soft:
+            logger.info("🔄 Soft refresh: re-fetched posts")
+        else:
+            super().refresh()
+    
     # ==================== WAITS ====================
     
     def wait_for_posts_to_load(self, timeout: int = 10000):
@@ -39,18 +67,55 @@ class NewsfeedPage(BasePage):
         return self.page.locator(NEWSFEED.POST_CARD).count()
     
     def get_all_post_titles(self) -> List[str]:
-        """Extract all post titles from current page."""
-        titles = []
-        post_cards = self.get_all_post_cards()
-        
-        for card in post_cards:
-            title_elem = card.locator(POST_CARD.TITLE).first
-            if title_elem.is_visible():
-                titles.append(title_elem.text_content().strip())
+        """Extract all visible post titles from current page (single browser round-trip)."""
+        titles = self.page.evaluate(
+            """([card, title]) => Array.from(document.querySelectorAll(card))
+                .map(c => c.querySelector(title))
+                .filter(el => el && el.getClientRects().length > 0)
+                .map(el => el.textContent.trim())""",
+            [NEWSFEED.POST_CARD, POST_CARD.TITLE]
+        )
         
         logger.info(f"📝 Found {len(titles)} post titles")
         return titles
     
+    def snapshot_first_card(self) -> Optional[Dict[str, Any]]:
+        """
+        Resolve the first post card's elements in a single DOM traversal.
+        
+        Returns:
+            Dict with a visibility flag per element (title, author, timestamp,
+            thumbnail, content_link, upvote, downvote, save, share, emoji)
+            plus `title_text`, or None if no card is rendered
+        """
+        selectors = {
+            "title": POST_CARD.TITLE,
+            "author": POST_CARD.AUTHOR_NAME,
+            "timestamp": POST_CARD.TIMESTAMP,
+            "thumbnail": POST_CARD.THUMBNAIL_IMAGE,
+            "content_link": POST_CARD.CONTENT_LINK,
+            "upvote": POST_CARD.UPVOTE_BUTTON,
+            "downvote": POST_CARD.DOWNVOTE_BUTTON,
+            "save": POST_CARD.SAVE_BUTTON,
+            "share": POST_CARD.SHARE_BUTTON,
+            "emoji": POST_CARD.ADD_EMOJI_BUTTON,
+        }
+        return self.page.evaluate(
+            """([card, selectors]) => {
+                const c = document.querySelector(card);
+                if (!c) return null;
+                const snapshot = {};
+                for (const [name, sel] of Object.entries(selectors)) {
+                    const el = c.querySelector(sel);
+                    snapshot[name] = !!el && el.getClientRects().length > 0;
+                }
+                const title = c.querySelector(selectors.title);
+                snapshot.title_text = title ? title.textContent.trim() : "";
+                return snapshot;
+            }""",
+            [NEWSFEED.POST_CARD, selectors]
+        )
+    
     def get_first_post_card(self) -> Locator:
         """Get first post card."""
         return self.page.locator(NEWSFEED.POST_CARD).first
@@ -110,4 +175,3 @@ class NewsfeedPage(BasePage):
         # Use .first to avoid strict mode violation with multiple posts
         first_post = self.page.locator(NEWSFEED.POST_CARD).first
         return self.is_visible(first_post)
-
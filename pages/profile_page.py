@@ -8,14 +8,29 @@ logger = log()
 
 class ProfilePage(BasePage):
     """User profile page interactions."""
-    
+
     def __init__(self, page: Page):
         super().__init__(page)
         from config.settings import settings
         self.base_url = settings.urls.base_ui
-    
-    def open_profile(self):
-        avatar = self.page.locator(PROFILE.HEADER_AVATAR_BTN).click()
-        self.click(avatar.locator(PROFILE.VIEW_PROFILE_MENU_ITEM))
 
-    
\ No newline at end of file
+        # Locators bound once per page object (lazy - resolved on use)
+        self.header_avatar_btn = page.locator(PROFILE.HEADER_AVATAR_BTN)
+        self.view_profile_menu_item = page.locator(PROFILE.VIEW_PROFILE_MENU_ITEM)
+        self.display_name = page.locator(PROFILE.DISPLAY_NAME)
+        self.avatar = page.locator(PROFILE.PROFILE_AVATAR)
+        self.followers_stat = page.locator(PROFILE.STAT_FOLLOWERS)
+        self.posts_tab = page.locator(PROFILE.TAB_POSTS)
+        self.communities_tab = page.locator(PROFILE.TAB_COMMUNITIES)
+        self.tab_content = page.locator(PROFILE.TAB_CONTENT)
+        self.post_cards = page.locator(PROFILE.POST_CARD)
+
+    def open_user_profile(self, user_id: int):
+        """Navigate to a user's profile page."""
+        super().open(f"{self.base_url}/profile/{user_id}")
+        logger.info(f"📄 Opened Profile Page: ID={user_id}")
+
+    def open_profile(self):
+        """Open own profile via header avatar menu."""
+        self.click(self.header_avatar_btn, "Header Avatar")
+        self.click(self.view_profile_menu_item, "View Profile Menu Item")
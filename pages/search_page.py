@@ -0,0 +1,47 @@
+from playwright.sync_api import Page, Response
+from core.base_page import BasePage
+from pages.locators.search_locators import SEARCH
+from core.logger import log
+
+logger = log()
+
+
+class SearchPage(BasePage):
+    """Search bar, suggestions and results interactions."""
+
+    def __init__(self, page: Page):
+        super().__init__(page)
+        from config.settings import settings
+        self.base_url = settings.urls.base_ui
+        # Backend search endpoint (SearchAPI.search)
+        self.search_api_url = f"{settings.urls.base_api}/search"
+
+        # Locators bound once per page object (lazy - resolved on use)
+        self.search_input = page.locator(SEARCH.SEARCH_INPUT)
+        self.search_button = page.locator(SEARCH.SEARCH_BUTTON)
+        self.suggestions = page.locator(SEARCH.SUGGESTIONS_DROPDOWN)
+        self.suggest_post_btn = page.locator(SEARCH.SUGGEST_POST_BTN)
+        self.suggest_user_btn = page.locator(SEARCH.SUGGEST_USER_BTN)
+        self.no_results_message = page.locator(SEARCH.NO_RESULTS_MESSAGE)
+
+    def open_results(self, query: str):
+        """Navigate directly to search results for `query`."""
+        super().open(f"{self.base_url}/search?q={query}")
+        logger.info(f"🔍 Opened Search Results: '{query}'")
+
+    def type_query(self, query: str):
+        """Type a query into the search bar."""
+        self.fill(self.search_input, query, "Search Input")
+
+    def _is_search_response(self, response: Response) -> bool:
+        return response.url.startswith(self.search_api_url) and response.ok
+
+    def expect_search_response(self, timeout: int = 5000):
+        """
+        Context manager waiting for a successful backend search response.
+
+        Usage:
+            with search.expect_search_response():
+                search.search_button.click()
+        """
+        return self.page.expect_response(self._is_search_response, timeout=timeout)
@@ -0,0 +1,144 @@
+"""
+Blog Posts API Tests
+====================
+API-only post tests (create, read, update, delete, performance).
+
+These tests only request API fixtures (`api`, `api_as_user`, `existing_user_api`,
+`test_post`, `test_posts`) from tests/conftest.py - never `page`, `context`,
+`browser` or `shared_page` - so running them never starts Playwright.
+
+Usage:
+    pytest tests/api -n auto
+"""
+
+import pytest
+from utils.api_client import BlogAPIClient
+from utils.data_builder import PostBuilder
+
+
+@pytest.mark.api
+@pytest.mark.posts
+class TestPostAPI:
+    """API-level post tests."""
+    
+    def test_create_post_via_api(self, api_as_user: BlogAPIClient):
+        """
+        Test ID: POST-API-001
+        Test creating post via API.
+        """
+        user_id = api_as_user._test_user["id"]
+        
+        post_data = PostBuilder() \
+            .with_author(user_id) \
+            .with_title("Test Post via API") \
+            .add_text_block("This is a test post") \
+            .build()
+        
+        response = api_as_user.posts.create_post(post_data.to_dict())
+        
+        assert response.success, f"Post creation failed: {response.data}"
+        assert response.status_code in [200, 201]
+        
+        # Verify response contains post ID
+        post_id = response.json.get("data", {}).get("id")
+        assert post_id is not None, "Response should contain post ID"
+    
+    def test_get_post_by_id(self, api_as_user: BlogAPIClient, test_post_readonly: dict):
+        """
+        Test ID: POST-API-002
+        Test retrieving post by ID via API.
+        """
+        response = api_as_user.posts.get_post(test_post_readonly["id"])
+        
+        assert response.success, "Should retrieve post successfully"
+        
+        data = response.json.get("data", {})
+        assert data.get("id") == test_post_readonly["id"]
+        assert data.get("title") == test_post_readonly["title"]
+    
+    def test_update_post(self, api_as_user: BlogAPIClient, test_post: dict):
+        """
+        Test ID: POST-API-003
+        Test updating post via API.
+        """
+        new_title = "Updated Title"
+        
+        response = api_as_user.posts.update_post(
+            test_post["id"],
+            {"title": new_title}
+        )
+        
+        assert response.success, "Update should succeed"
+        
+        # Verify update
+        get_response = api_as_user.posts.get_post(test_post["id"])
+        updated_title = get_response.json.get("data", {}).get("title")
+        assert updated_title == new_title, "Title should be updated"
+    
+    def test_delete_post(self, api_as_user: BlogAPIClient):
+        """
+        Test ID: POST-API-004
+        Test deleting post via API.
+        """
+        # Create a post
+        from utils.data_builder import create_quick_post
+        user_id = api_as_user._test_user["id"]
+        post_data = create_quick_post(user_id)
+        
+        create_resp = api_as_user.posts.create_post(post_data.to_dict())
+        post_id = create_resp.json.get("data", {}).get("id")
+        
+        # Delete it
+        delete_resp = api_as_user.posts.delete_post(post_id)
+        assert delete_resp.success, "Delete should succeed"
+        
+        # Verify deleted (404 when trying to get)
+        get_resp = api_as_user.posts.get_post(post_id)
+        assert get_resp.status_code == 404, "Post should not exist after deletion"
+
+
+@pytest.mark.regression
+@pytest.mark.slow
+def test_multiple_posts_creation_performance(api_as_user: BlogAPIClient, benchmark, request):
+    """
+    Test ID: POST-PERF-001
+    Benchmark creating 10 posts concurrently via API.
+    
+    Performance budget: mean of 3 rounds < 2 seconds. Only the 10 parallel
+    POSTs are timed - login and payload building happen outside the rounds,
+    and one warm-up round absorbs connection setup. Every created post
+    (warm-up included) is deleted at teardown.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from utils.data_builder import create_quick_post
+    
+    user_id = api_as_user._test_user["id"]
+    created_ids = []
+    
+    def cleanup():
+        api_as_user.map(api_as_user.posts.delete_post, created_ids)
+    
+    request.addfinalizer(cleanup)
+    
+    def build_payloads():
+        return ([create_quick_post(user_id).to_dict() for _ in range(10)],), {}
+    
+    def create_all(posts):
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            responses = list(executor.map(api_as_user.posts.create_post, posts))
+        created_ids.extend(
+            response.json.get("data", {}).get("id") for response in responses if response.success
+        )
+        return responses
+    
+    responses = benchmark.pedantic(
+        create_all, setup=build_payloads, rounds=3, iterations=1, warmup_rounds=1
+    )
+    
+    failed = [i + 1 for i, response in enumerate(responses) if not response.success]
+    assert not failed, f"Post creation failed for posts: {failed}"
+    
+    # Stats are unavailable when benchmarking is disabled (e.g. under xdist)
+    if benchmark.stats:
+        mean = benchmark.stats.stats.mean
+        assert mean < 2.0, f"Creating 10 posts took {mean:.2f}s on average, should be < 2s"
@@ -1,10 +1,13 @@
+import os
 import pytest
-from typing import Dict, Any, Generator
-from playwright.sync_api import Playwright, Browser, BrowserContext, Page, sync_playwright
+from typing import Dict, Any, Generator, Optional
+from playwright.sync_api import Playwright, Browser, BrowserContext, Locator, Page, sync_playwright
 
 from config.settings import settings
 from core.logger import log
-from utils.api_client import BlogAPIClient
+from pages.newsfeed_page import NewsfeedPage
+from pages.post_details_page import PostDetailsPage
+from utils.api_client import BlogAPIClient, get_shared_client
 from utils.data_builder import create_quick_post
 
 logger = log()
@@ -14,6 +17,23 @@ logger = log()
 # PYTEST CONFIGURATION HOOKS
 # ============================================
 
+def pytest_addoption(parser):
+    """Register custom command line options."""
+    parser.addoption(
+        "--wip",
+        action="store_true",
+        default=False,
+        help="Run work-in-progress tests (marked with @pytest.mark.wip)"
+    )
+    parser.addoption(
+        "--browser",
+        action="store",
+        default="chromium",
+        choices=["chromium", "firefox", "webkit"],
+        help="Browser engine to run UI tests on. Non-chromium runs only collect smoke tests"
+    )
+
+
 def pytest_configure(config):
     """
     Called before test run starts.
@@ -34,7 +54,9 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "newsfeed: Newsfeed/homepage tests")
     config.addinivalue_line("markers", "interactions: User interaction tests")
     config.addinivalue_line("markers", "admin: Admin panel tests")
-    
+    config.addinivalue_line("markers", "xdist_group(name): Keep tests on one worker with --dist loadgroup")
+    config.addinivalue_line("markers", "block_resources: Abort images/fonts/media and analytics in this test's browser context")
+
     logger.info("=" * 80)
     logger.info("🚀 BLOG WEBSITE TEST AUTOMATION - STARTING")
     logger.info(f"📍 Environment: {settings.environment.value.upper()}")
@@ -47,6 +69,32 @@ def pytest_configure(config):
     (settings.project_root / "screenshots").mkdir(exist_ok=True)
     (settings.project_root / "reports").mkdir(exist_ok=True)
     (settings.project_root / "logs" / "videos").mkdir(exist_ok=True)
+    (settings.project_root / "logs" / "traces").mkdir(exist_ok=True)
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Deselect tests that should not run in this session:
+    - work-in-progress tests unless --wip is passed
+    - non-smoke tests on firefox/webkit (full suite runs on chromium only)
+    Keeps normal runs free of skip reports for these tests.
+    """
+    run_wip = config.getoption("--wip")
+    smoke_only = config.getoption("--browser") != "chromium"
+    if run_wip and not smoke_only:
+        return
+
+    def is_deselected(item) -> bool:
+        if not run_wip and "wip" in item.keywords:
+            return True
+        return smoke_only and "smoke" not in item.keywords
+
+    selected = [item for item in items if not is_deselected(item)]
+    deselected = [item for item in items if is_deselected(item)]
+
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
 
 
 def pytest_unconfigure(config):
@@ -66,10 +114,19 @@ def pytest_runtest_makereport(item, call):
     outcome = yield
     report = outcome.get_result()
     
+    # Remember call outcome for fixture teardown (trace kept only on failure)
+    if report.when == "call":
+        item._call_failed = report.failed
+    
     # Only capture screenshot on test failure during 'call' phase
     if report.when == "call" and report.failed:
         # Try to get page fixture from test
-        page = item.funcargs.get('page')
+        page = (
+            item.funcargs.get('page')
+            or item.funcargs.get('logged_in_page')
+            or item.funcargs.get('profile_page')
+            or item.funcargs.get('shared_page')
+        )
         if page:
             test_name = item.nodeid.replace("::", "_").replace("/", "_").replace(" ", "_")
             timestamp = settings.get_current_timestamp()
@@ -86,7 +143,7 @@ def pytest_runtest_makereport(item, call):
     
     # Rename video after test completes (during teardown phase)
     if report.when == "teardown":
-        page = item.funcargs.get('page')
+        page = item.funcargs.get('page') or item.funcargs.get('logged_in_page')
         if page and settings.browser.RECORD_VIDEO:
             try:
                 video = page.video
@@ -108,7 +165,6 @@ def pytest_runtest_makereport(item, call):
                     new_path = settings.project_root / "logs" / "videos" / new_video_name
                     
                     # Rename video file
-                    import os
                     if os.path.exists(original_path):
                         os.rename(original_path, new_path)
                         logger.info(f"🎬 Video saved: {new_path}")
@@ -116,6 +172,31 @@ def pytest_runtest_makereport(item, call):
                 logger.debug(f"⚠️ Could not rename video: {e}")
 
 
+def _wants_blocking(request) -> bool:
+    """True if the requesting test/class/module is marked `block_resources`."""
+    return request.node.get_closest_marker("block_resources") is not None
+
+
+def _start_tracing(context: BrowserContext):
+    """Start Playwright tracing on a context when RECORD_TRACE is enabled."""
+    if settings.browser.RECORD_TRACE:
+        context.tracing.start(screenshots=True, snapshots=True, sources=False)
+
+
+def _stop_tracing(context: BrowserContext, request):
+    """Save the trace only if the test's call phase failed, otherwise discard it."""
+    if not settings.browser.RECORD_TRACE:
+        return
+    
+    if getattr(request.node, "_call_failed", False):
+        test_name = request.node.nodeid.replace("::", "_").replace("/", "_").replace(" ", "_")
+        trace_path = settings.project_root / "logs" / "traces" / f"FAILED_{test_name}.zip"
+        context.tracing.stop(path=str(trace_path))
+        logger.error(f"🧵 Failure trace saved: {trace_path}")
+    else:
+        context.tracing.stop()
+
+
 # ============================================
 # BROWSER & PAGE FIXTURES
 # ============================================
@@ -133,16 +214,18 @@ def playwright_instance() -> Generator[Playwright, None, None]:
 
 
 @pytest.fixture(scope="session")
-def browser(playwright_instance: Playwright) -> Generator[Browser, None, None]:
+def browser(request, playwright_instance: Playwright) -> Generator[Browser, None, None]:
     """
     Session-scoped browser instance.
     Launches browser once and reuses across tests.
     
-    For parallel execution, change scope to 'function'.
+    Engine comes from --browser (default chromium).
+    Under pytest-xdist each worker process launches its own browser.
     """
-    logger.info(f"🌐 Launching browser (Headless={settings.browser.HEADLESS})...")
+    browser_name = request.config.getoption("--browser")
+    logger.info(f"🌐 Launching {browser_name} (Headless={settings.browser.HEADLESS})...")
     
-    browser = playwright_instance.chromium.launch(
+    browser = getattr(playwright_instance, browser_name).launch(
         headless=settings.browser.HEADLESS,
         slow_mo=settings.browser.SLOW_MO
     )
@@ -154,20 +237,62 @@ def browser(playwright_instance: Playwright) -> Generator[Browser, None, None]:
     browser.close()
 
 
+@pytest.fixture(scope="session")
+def warm_storage_state(browser: Browser) -> Optional[str]:
+    """
+    Session-scoped warm-up visit to the base UI (once per worker).
+    
+    Pays the cold first-hit cost (dev server bundle compile, server/CDN
+    caches) once instead of in the first test, and saves the visit's
+    storage state so every new context starts from it.
+    
+    Returns:
+        Path to the storage state file, or None if the warm-up failed
+    """
+    from core.browser_factory import BrowserFactory
+    
+    worker = os.getenv("PYTEST_XDIST_WORKER", "master")
+    state_path = settings.project_root / ".pw-cache" / f"state_{worker}.json"
+    state_path.parent.mkdir(exist_ok=True)
+    
+    context = BrowserFactory.create_context(browser)
+    try:
+        page = context.new_page()
+        page.goto(settings.urls.base_ui, wait_until="networkidle")
+        context.storage_state(path=str(state_path))
+        logger.info(f"🔥 Warmed up {settings.urls.base_ui} (state: {state_path.name})")
+        return str(state_path)
+    except Exception as e:
+        logger.warning(f"⚠️ Warm-up visit failed, contexts start empty: {e}")
+        return None
+    finally:
+        context.close()
+
+
 @pytest.fixture(scope="function")
-def context(browser: Browser) -> Generator[BrowserContext, None, None]:
+def context(
+    request,
+    browser: Browser,
+    warm_storage_state: Optional[str]
+) -> Generator[BrowserContext, None, None]:
     """
     Function-scoped browser context.
     Creates isolated context for each test (fresh cookies, storage).
     """
     from core.browser_factory import BrowserFactory
     
-    context = BrowserFactory.create_context(browser)
+    context = BrowserFactory.create_context(
+        browser,
+        block_resources=_wants_blocking(request),
+        storage_state=warm_storage_state
+    )
+    _start_tracing(context)
     logger.debug("🪟 Created new browser context")
     
     yield context
     
     # Cleanup
+    _stop_tracing(context, request)
     context.close()
     logger.debug("🪟 Closed browser context")
 
@@ -188,6 +313,28 @@ def page(context: BrowserContext) -> Generator[Page, None, None]:
     logger.debug("📄 Closed page")
 
 
+@pytest.fixture(scope="class")
+def shared_page(browser: Browser, warm_storage_state: Optional[str]) -> Generator[Page, None, None]:
+    """
+    Class-scoped page (one browser context per test class).
+    
+    For read-only tests that only navigate and assert, so the class pays
+    for a single context instead of one per test. Each test should still
+    call page.goto() itself. Tests that depend on isolation (login flows,
+    mutations) must keep the function-scoped `page` fixture.
+    """
+    from core.browser_factory import BrowserFactory
+    
+    context = BrowserFactory.create_context(browser, storage_state=warm_storage_state)
+    page = context.new_page()
+    logger.debug("🪟 Created shared browser context for class")
+    
+    yield page
+    
+    context.close()
+    logger.debug("🪟 Closed shared browser context")
+
+
 # ============================================
 # API FIXTURES
 # ============================================
@@ -196,12 +343,12 @@ def page(context: BrowserContext) -> Generator[Page, None, None]:
 def api() -> Generator[BlogAPIClient, None, None]:
     """
     Session-scoped API client.
-    Reuses HTTP session across tests.
+    Reuses the process-wide shared client (one HTTP session/pool).
     
     Note: For tests requiring different users, use `api_as_user` fixture.
     """
     logger.info("🔌 Initializing API client...")
-    client = BlogAPIClient()
+    client = get_shared_client()
     
     yield client
     
@@ -254,17 +401,16 @@ def api_as_user(api: BlogAPIClient) -> Generator[BlogAPIClient, None, None]:
 # AUTHENTICATION FIXTURES
 # ============================================
 
-@pytest.fixture(scope="function")
-def auth_user(page: Page, api: BlogAPIClient) -> Dict[str, Any]:
+@pytest.fixture(scope="session")
+def auth_session() -> Dict[str, Any]:
     """
-    Provides authenticated user in both UI and API.
+    Logs the existing verified account in once per session (once per worker).
     
-    Uses existing verified account to login via API, then injects token.
     NOTE: Backend requires email verification before login, so we must use
     an existing verified account instead of creating a new one.
     
     Returns:
-        Dict with user info: {email, name, password, id, cookies}
+        Dict with user info: {email, name, password, id, access_token, profile_url}
     """
     # Use existing verified account (configured in .env)
     if not settings.existing_user_creds.is_valid:
@@ -273,50 +419,184 @@ def auth_user(page: Page, api: BlogAPIClient) -> Dict[str, Any]:
     email = settings.existing_user_creds.email
     password = settings.existing_user_creds.password
     
-    # Login via API
-    login_response = api.auth.login(email, password)
-    assert login_response.success, f"Login failed: {login_response.data}"
-    
-    user_info = login_response.json.get("data", {}).get("user", {})
-    user_id = user_info.get("id")
-    user_name = user_info.get("username")
-    
-    # The auth token is already set in api.session headers by login()
-    # We need to also set it in the browser for UI tests
-    access_token = login_response.json.get("data", {}).get("accessToken")
-    
-    # Navigate to domain first
-    page.goto(settings.urls.base_ui)
+    # Dedicated client so the shared `api` session stays anonymous
+    client = BlogAPIClient()
+    try:
+        login_response = client.auth.login(email, password)
+        assert login_response.success, f"Login failed: {login_response.data}"
+    finally:
+        client.clear_session()
     
-    # Store token in localStorage (common pattern for SPAs)
-    page.evaluate(f"""
-        localStorage.setItem('accessToken', '{access_token}');
-    """)
+    data = login_response.json.get("data", {})
+    user_info = data.get("user", {})
     
-    logger.info(f"🔐 Authenticated user ready: {email} (ID: {user_id})")
+    logger.info(f"🔐 Session login done: {email} (ID: {user_info.get('id')})")
     
     return {
         "email": email,
-        "name": user_name,
+        "name": user_info.get("username"),
         "password": password,
-        "id": user_id,
-        "access_token": access_token
+        "id": user_info.get("id"),
+        "access_token": data.get("accessToken"),
+        "profile_url": f"{settings.urls.base_ui}/profile/{user_info.get('id')}"
     }
 
 
+@pytest.fixture(scope="session")
+def auth_state(
+    browser: Browser,
+    auth_session: Dict[str, Any],
+    warm_storage_state: Optional[str]
+) -> str:
+    """
+    Authenticated storage state file, generated once per worker.
+    
+    Injects the session token into localStorage (common pattern for SPAs)
+    and saves the context state so every `logged_in_page` context starts
+    already logged in, without repeating the auth flow.
+    
+    Returns:
+        Path to the storage state file
+    """
+    from core.browser_factory import BrowserFactory
+    
+    worker = os.getenv("PYTEST_XDIST_WORKER", "master")
+    state_path = settings.project_root / ".auth" / f"{worker}.json"
+    state_path.parent.mkdir(exist_ok=True)
+    
+    context = BrowserFactory.create_context(browser, storage_state=warm_storage_state)
+    try:
+        page = context.new_page()
+        page.goto(settings.urls.base_ui)
+        page.evaluate(
+            "token => localStorage.setItem('accessToken', token)",
+            auth_session["access_token"]
+        )
+        context.storage_state(path=str(state_path))
+    finally:
+        context.close()
+    
+    logger.info(f"🔐 Authenticated storage state saved: {state_path.name}")
+    return str(state_path)
+
+
 @pytest.fixture(scope="function")
-def logged_in_page(auth_user: Dict[str, Any], page: Page) -> Page:
+def auth_user(auth_session: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Page with authenticated user session.
-    Ready to navigate to any protected page.
+    Provides the authenticated user info (session login, no per-test auth).
+    
+    Returns:
+        Dict with user info: {email, name, password, id, access_token, profile_url}
+    """
+    return dict(auth_session)
+
+
+@pytest.fixture(scope="function")
+def logged_in_page(request, browser: Browser, auth_state: str) -> Generator[Page, None, None]:
+    """
+    Page with authenticated user session, already on the home page.
+    Fresh context per test, restored from the session's authenticated state.
     
     Usage:
         def test_create_post(logged_in_page):
             logged_in_page.goto("/create-post")
             # User is already logged in
     """
+    from core.browser_factory import BrowserFactory
+    
+    context = BrowserFactory.create_context(
+        browser,
+        block_resources=_wants_blocking(request),
+        storage_state=auth_state
+    )
+    _start_tracing(context)
+    page = context.new_page()
+    # Land on the home page so tests starting there can skip their own goto (ensure_at)
+    page.goto(settings.urls.base_ui, wait_until="domcontentloaded")
     logger.info("📄 Page with authenticated session ready")
-    return page
+    
+    yield page
+    
+    _stop_tracing(context, request)
+    context.close()
+
+
+@pytest.fixture(scope="class")
+def profile_page(
+    request,
+    browser: Browser,
+    auth_state: str,
+    auth_session: Dict[str, Any]
+) -> Generator[Page, None, None]:
+    """
+    Class-scoped authenticated page already opened on the user's profile.
+    
+    Navigates once per class, so read-only profile tests only assert.
+    Tests that click away or change state should use `logged_in_page`.
+    
+    Usage:
+        def test_profile_displays_avatar(self, profile_page):
+            expect(profile_page.locator(PROFILE.PROFILE_AVATAR)).to_be_visible()
+    """
+    from core.browser_factory import BrowserFactory
+    
+    context = BrowserFactory.create_context(
+        browser,
+        block_resources=_wants_blocking(request),
+        storage_state=auth_state
+    )
+    page = context.new_page()
+    page.goto(auth_session["profile_url"])
+    logger.info("📄 Profile page ready (class-scoped)")
+    
+    yield page
+    
+    context.close()
+
+
+# ============================================
+# PAGE OBJECT FIXTURES
+# ============================================
+
+@pytest.fixture(scope="function")
+def post_details_page(logged_in_page: Page) -> PostDetailsPage:
+    """
+    PostDetailsPage bound to the authenticated page.
+    
+    Usage:
+        def test_add_comment(post_details_page, test_post):
+            post_details_page.open_post(test_post["id"])
+    """
+    return PostDetailsPage(logged_in_page)
+
+
+@pytest.fixture(scope="function")
+def newsfeed_page(logged_in_page: Page) -> NewsfeedPage:
+    """NewsfeedPage bound to the authenticated page."""
+    return NewsfeedPage.for_page(logged_in_page)
+
+
+@pytest.fixture(scope="class")
+def loaded_newsfeed(shared_page: Page) -> NewsfeedPage:
+    """
+    Class-scoped NewsfeedPage, opened once (unauthenticated).
+    
+    For read-only post card tests that only assert on the DOM, so the
+    whole class shares a single homepage load.
+    
+    Usage:
+        def test_post_card_has_title(self, loaded_newsfeed):
+            first_post = loaded_newsfeed.get_first_post_card()
+    """
+    newsfeed = NewsfeedPage.for_page(shared_page)
+    newsfeed.open()
+    return newsfeed
+
+
+@pytest.fixture(scope="class")
+def first_post(loaded_newsfeed: NewsfeedPage) -> Locator:
+    """First post card locator on the class-scoped newsfeed."""
+    return loaded_newsfeed.get_first_post_card()
 
 
 # ============================================
@@ -408,20 +688,11 @@ def existing_user_page(page: Page, existing_user_api: BlogAPIClient) -> Page:
 # TEST DATA FIXTURES
 # ============================================
 
-@pytest.fixture(scope="function")
-def test_post(api_as_user: BlogAPIClient) -> Dict[str, Any]:
-    """
-    Creates a test post via API.
-    
-    Returns:
-        Dict with post data: {id, title, author_id}
-    """
-    user_id = api_as_user._test_user["id"]
-    
-    # Create post
+def _create_test_post(client: BlogAPIClient, user_id: int) -> Dict[str, Any]:
+    """Create a quick post via API and return {id, title, author_id}."""
     post_data = create_quick_post(author_id=user_id, blocks_count=2)
     
-    response = api_as_user.posts.create_post(post_data.to_dict())
+    response = client.posts.create_post(post_data.to_dict())
     assert response.success, f"Failed to create test post: {response.data}"
     
     post_id = response.json.get("data", {}).get("id")
@@ -434,6 +705,108 @@ def test_post(api_as_user: BlogAPIClient) -> Dict[str, Any]:
     }
 
 
+@pytest.fixture(scope="function")
+def test_post(api_as_user: BlogAPIClient) -> Dict[str, Any]:
+    """
+    Creates a test post via API.
+    
+    Use this for tests that mutate the post (update, delete, votes).
+    For read-only tests use `test_post_readonly`.
+    
+    Returns:
+        Dict with post data: {id, title, author_id}
+    """
+    return _create_test_post(api_as_user, api_as_user._test_user["id"])
+
+
+@pytest.fixture(scope="session")
+def test_post_readonly() -> Generator[Dict[str, Any], None, None]:
+    """
+    Session-scoped test post shared by read-only tests.
+    
+    Created once per session (per worker with xdist) and deleted at session
+    end. Tests using it must not modify or delete the post.
+    
+    Returns:
+        Dict with post data: {id, title, author_id}
+    """
+    creds = settings.existing_user_creds
+    
+    if not creds.is_valid:
+        pytest.skip("No existing verified user credentials configured in settings")
+    
+    # Dedicated client so the shared `api` session stays anonymous
+    client = BlogAPIClient()
+    login_response = client.auth.login(creds.email, creds.password)
+    
+    if not login_response.success:
+        pytest.fail(f"Failed to login with existing account: {login_response.data}")
+    
+    user_id = login_response.json.get("data", {}).get("user", {}).get("id")
+    post = None
+    
+    try:
+        post = _create_test_post(client, user_id)
+        yield post
+    finally:
+        if post:
+            client.posts.delete_post(post["id"])
+            logger.info(f"🧹 Removed read-only test post: ID={post['id']}")
+        client.auth.logout()
+        client.clear_session()
+
+
+@pytest.fixture(scope="session")
+def seeded_newsfeed() -> Generator[list[Dict[str, Any]], None, None]:
+    """
+    Seeds the newsfeed with 3 posts via API before newsfeed UI tests run.
+    
+    Makes "at least one post exists" deterministic on a fresh database.
+    Seeded posts are deleted at session end. Falls back to ambient data
+    (empty list) when no existing account is configured.
+    
+    Usage:
+        pytestmark = pytest.mark.usefixtures("seeded_newsfeed")
+    """
+    creds = settings.existing_user_creds
+    
+    if not creds.is_valid:
+        logger.warning("⚠️ No existing user configured - newsfeed tests use ambient data")
+        yield []
+        return
+    
+    client = BlogAPIClient()
+    login_response = client.auth.login(creds.email, creds.password)
+    
+    if not login_response.success:
+        pytest.fail(f"Failed to login with existing account: {login_response.data}")
+    
+    user_id = login_response.json.get("data", {}).get("user", {}).get("id")
+    
+    def create(_) -> Any:
+        # Return the error instead of raising so the other creates are kept
+        try:
+            return _create_test_post(client, user_id)
+        except Exception as e:
+            return e
+    
+    # Independent creates - run them concurrently on the client's pool
+    results = client.map(create, range(3))
+    posts = [result for result in results if not isinstance(result, Exception)]
+    errors = [result for result in results if isinstance(result, Exception)]
+    
+    try:
+        # Cleanup is registered first, so a partial seed is still removed
+        assert not errors, f"Failed to seed newsfeed: {errors[0]}"
+        logger.info(f"🌱 Seeded newsfeed with {len(posts)} posts")
+        yield posts
+    finally:
+        client.map(client.posts.delete_post, [post["id"] for post in posts])
+        client.auth.logout()
+        client.clear_session()
+        logger.info(f"🧹 Removed {len(posts)} seeded newsfeed posts")
+
+
 @pytest.fixture(scope="function")
 def test_posts(api_as_user: BlogAPIClient) -> list[Dict[str, Any]]:
     """
@@ -443,19 +816,18 @@ def test_posts(api_as_user: BlogAPIClient) -> list[Dict[str, Any]]:
         List of post dicts
     """
     user_id = api_as_user._test_user["id"]
-    posts = []
-    
-    for i in range(3):
-        post_data = create_quick_post(author_id=user_id)
-        response = api_as_user.posts.create_post(post_data.to_dict())
-        
-        if response.success:
-            post_id = response.json.get("data", {}).get("id")
-            posts.append({
-                "id": post_id,
-                "title": post_data.title,
-                "author_id": user_id
-            })
+    post_datas = [create_quick_post(author_id=user_id) for _ in range(3)]
+    responses = api_as_user.posts.create_posts([post_data.to_dict() for post_data in post_datas])
+    
+    posts = [
+        {
+            "id": response.json.get("data", {}).get("id"),
+            "title": post_data.title,
+            "author_id": user_id
+        }
+        for post_data, response in zip(post_datas, responses)
+        if response.success
+    ]
     
     logger.info(f"📝 Created {len(posts)} test posts")
     return posts
@@ -0,0 +1 @@
+# Test helpers package initialization
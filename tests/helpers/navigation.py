@@ -0,0 +1,32 @@
+"""
+Navigation Helpers
+==================
+Skip navigations the page has already done.
+
+Usage:
+    from tests.helpers.navigation import ensure_at
+    
+    ensure_at(logged_in_page, settings.urls.base_ui)
+"""
+
+from playwright.sync_api import Page
+from core.logger import log
+
+logger = log()
+
+
+def ensure_at(page: Page, url: str):
+    """
+    Navigate to `url` only if the page is not already there.
+    
+    Compares full URLs ignoring a trailing slash, so being on a sub-page
+    (e.g. /profile/1 when `url` is the base UI) still navigates.
+    
+    Args:
+        page: Playwright page
+        url: Target URL
+    """
+    if page.url.rstrip("/") == url.rstrip("/"):
+        logger.debug(f"📍 Already at {url}, skipping navigation")
+        return
+    page.goto(url, wait_until="domcontentloaded")
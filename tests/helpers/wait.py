@@ -0,0 +1,34 @@
+"""
+Wait Helpers
+============
+Event-based waits to use instead of fixed `page.wait_for_timeout()` sleeps.
+
+Usage:
+    from tests.helpers.wait import wait_after_action
+    
+    upvote_btn.click()
+    wait_after_action(page)
+"""
+
+from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
+from core.logger import log
+
+logger = log()
+
+
+def wait_after_action(page: Page, timeout: int = 3000):
+    """
+    Wait for network activity triggered by a UI action to settle.
+    
+    Returns as soon as the page is network-idle instead of always sleeping
+    for a fixed time. If the page keeps polling (analytics, websockets)
+    the wait gives up after `timeout` ms without failing the test.
+    
+    Args:
+        page: Playwright page the action was performed on
+        timeout: Max time to wait for network idle (ms)
+    """
+    try:
+        page.wait_for_load_state("networkidle", timeout=timeout)
+    except PlaywrightTimeoutError:
+        logger.debug(f"⏳ Network not idle after {timeout}ms, continuing")
@@ -7,7 +7,6 @@ Strategy: Hybrid API + UI
 """
 
 import pytest
-from playwright.sync_api import Page
 from pages.post_details_page import PostDetailsPage
 from utils.api_client import BlogAPIClient
 from utils.data_builder import CommentBuilder
@@ -23,15 +22,15 @@ class TestComments:
     
     def test_add_comment_to_post(
         self,
-        logged_in_page: Page,
+        post_details_page: PostDetailsPage,
         test_post: dict
     ):
         """
         Test ID: COMMENT-001
         Test adding comment to a post via UI.
         """
-        page = logged_in_page
-        post_page = PostDetailsPage(page)
+        post_page = post_details_page
+        page = post_page.page
         
         post_page.open_post(test_post["id"])
         
@@ -55,7 +54,7 @@ class TestComments:
     
     def test_reply_to_comment(
         self,
-        logged_in_page: Page,
+        post_details_page: PostDetailsPage,
         test_post: dict,
         api_as_user: BlogAPIClient
     ):
@@ -66,7 +65,8 @@ class TestComments:
         Setup: Create initial comment via API
         Test: Reply via UI
         """
-        page = logged_in_page
+        post_page = post_details_page
+        page = post_page.page
         
         # SETUP: Create a comment via API first
         user_id = api_as_user._test_user["id"]
@@ -84,7 +84,6 @@ class TestComments:
         assert comment_resp.success, "Failed to create parent comment"
         
         # TEST: Reply via UI
-        post_page = PostDetailsPage(page)
         post_page.open_post(test_post["id"])
         
         reply_text = "This is a reply!"
@@ -110,15 +109,15 @@ class TestComments:
     
     def test_comment_shows_author_info(
         self,
-        logged_in_page: Page,
+        post_details_page: PostDetailsPage,
         test_post: dict
     ):
         """
         Test ID: COMMENT-003
         Test comment displays author information.
         """
-        page = logged_in_page
-        post_page = PostDetailsPage(page)
+        post_page = post_details_page
+        page = post_page.page
         
         # Add a comment
         post_page.open_post(test_post["id"])
@@ -249,7 +248,7 @@ class TestCommentsAPI:
 
 @pytest.mark.regression
 def test_nested_replies_structure(
-    logged_in_page: Page,
+    post_details_page: PostDetailsPage,
     api_as_user: BlogAPIClient,
     test_post: dict
 ):
@@ -259,7 +258,8 @@ def test_nested_replies_structure(
     
     Creates multi-level replies and verifies structure in UI.
     """
-    page = logged_in_page
+    post_page = post_details_page
+    page = post_page.page
     user_id = api_as_user._test_user["id"]
     
     # Create parent comment
@@ -288,7 +288,6 @@ def test_nested_replies_structure(
     )
     
     # VERIFY in UI
-    post_page = PostDetailsPage(page)
     post_page.open_post(test_post["id"])
     
     # Scroll to comments section
@@ -1,11 +1,16 @@
+import logging
 import pytest
 from playwright.sync_api import Page
 from pages.newsfeed_page import NewsfeedPage
 from pages.post_details_page import PostDetailsPage
 from utils.api_client import BlogAPIClient
+from core.logger import log
 
+logger = log()
 
-@pytest.mark.skip(reason="UI selectors need to be updated after inspecting actual frontend HTML")
+
+# UI selectors need to be updated after inspecting actual frontend HTML
+@pytest.mark.wip
 @pytest.mark.ui
 @pytest.mark.smoke
 class TestWithExistingAccount:
@@ -22,19 +27,19 @@ class TestWithExistingAccount:
         page = existing_user_page
         
         # Navigate to newsfeed
-        newsfeed = NewsfeedPage(page)
+        newsfeed = NewsfeedPage.for_page(page)
         newsfeed.open()
         
         # Verify posts are visible
         assert newsfeed.is_posts_container_visible(), "Posts should be visible"
         
         post_count = newsfeed.get_post_count()
-        print(f"📊 Found {post_count} posts in newsfeed")
+        logger.debug("📊 Found %d posts in newsfeed", post_count)
         
         # If this account has posts, we should see them
         if post_count > 0:
             titles = newsfeed.get_all_post_titles()
-            print(f"📝 Post titles: {titles}")
+            logger.debug("📝 Post titles: %s", titles)
             assert len(titles) > 0, "Should have post titles"
     
     def test_existing_account_can_create_post(
@@ -64,10 +69,10 @@ class TestWithExistingAccount:
         assert response.success, f"Post creation failed: {response.data}"
         
         post_id = response.json.get("data", {}).get("id")
-        print(f"✅ Created post ID: {post_id}")
+        logger.debug("✅ Created post ID: %s", post_id)
         
         # Verify in UI
-        newsfeed = NewsfeedPage(page)
+        newsfeed = NewsfeedPage.for_page(page)
         newsfeed.open()
         
         titles = newsfeed.get_all_post_titles()
@@ -119,9 +124,9 @@ class TestExistingAccountAPI:
         assert response.success, "Should get user info"
         
         data = response.json.get("data", {})
-        print(f"👤 User ID: {data.get('id')}")
-        print(f"📧 Email: {data.get('email')}")
-        print(f"👨‍💼 Username: {data.get('username')}")
+        logger.debug("👤 User ID: %s", data.get("id"))
+        logger.debug("📧 Email: %s", data.get("email"))
+        logger.debug("👨‍💼 Username: %s", data.get("username"))
         
         assert data.get("email") == existing_user_api._test_user["email"]
     
@@ -144,11 +149,12 @@ class TestExistingAccountAPI:
         data = response.json.get("data", {})
         posts = data.get("items", [])
         
-        print(f"📊 Found {len(posts)} posts in newsfeed")
+        logger.debug("📊 Found %d posts in newsfeed", len(posts))
         
-        # Print post titles
-        for post in posts[:5]:  # First 5
-            print(f"  - {post.get('title')}")
+        # Log post titles (skipped entirely when DEBUG is disabled)
+        if logger.isEnabledFor(logging.DEBUG):
+            for post in posts[:5]:  # First 5
+                logger.debug("  - %s", post.get("title"))
 
 
 @pytest.mark.smoke
@@ -170,8 +176,8 @@ def test_comparison_existing_vs_new_user(
     new_resp = api_as_user.posts.get_newsfeed()
     new_posts = new_resp.json.get("data", {}).get("items", [])
     
-    print(f"📊 Existing account sees: {len(existing_posts)} posts")
-    print(f"📊 New account sees: {len(new_posts)} posts")
+    logger.debug("📊 Existing account sees: %d posts", len(existing_posts))
+    logger.debug("📊 New account sees: %d posts", len(new_posts))
     
     # New account is isolated, might see fewer posts
     assert isinstance(existing_posts, list)
@@ -9,10 +9,12 @@ Strategy:
 - Test authenticated vs unauthenticated navigation
 """
 
+import re
 import pytest
 from playwright.sync_api import Page, expect
 from pages.locators.navigation_locators import SIDEBAR
 from core.logger import log
+from tests.helpers.navigation import ensure_at
 from config.settings import settings
 
 logger = log()
@@ -23,11 +25,12 @@ logger = log()
 class TestSidebarVisibility:
     """Sidebar visibility tests."""
     
-    def test_sidebar_visible_on_homepage(self, page: Page):
+    def test_sidebar_visible_on_homepage(self, shared_page: Page):
         """
         Test ID: NAV-001
         Verify sidebar is visible on homepage.
         """
+        page = shared_page
         page.goto(settings.urls.base_ui)
         
         sidebar = page.locator(SIDEBAR.SIDEBAR)
@@ -36,11 +39,12 @@ class TestSidebarVisibility:
         if page.viewport_size and page.viewport_size.get("width", 0) >= 768:
             expect(sidebar).to_be_visible(timeout=10000)
     
-    def test_logo_visible_in_sidebar(self, page: Page):
+    def test_logo_visible_in_sidebar(self, shared_page: Page):
         """
         Test ID: NAV-002
         Verify Blookie logo is visible.
         """
+        page = shared_page
         page.goto(settings.urls.base_ui)
         
         logo = page.locator(SIDEBAR.LOGO)
@@ -52,7 +56,7 @@ class TestSidebarVisibility:
         Verify 'Tạo bài viết' button is visible for logged-in users.
         """
         page = logged_in_page
-        page.goto(settings.urls.base_ui)
+        ensure_at(page, settings.urls.base_ui)
         
         create_btn = page.locator(SIDEBAR.CREATE_POST_BUTTON)
         expect(create_btn).to_be_visible(timeout=10000)
@@ -71,7 +75,6 @@ class TestSidebarNavigation:
         page = logged_in_page
         # Navigate to a different page first
         page.goto(f"{settings.urls.base_ui}/search")
-        page.wait_for_load_state("networkidle")
         
         home_link = page.locator(SIDEBAR.HOME_LINK).first
         
@@ -92,7 +95,7 @@ class TestSidebarNavigation:
         Verify clicking 'Đã lưu' link navigates to saved posts.
         """
         page = logged_in_page
-        page.goto(settings.urls.base_ui)
+        ensure_at(page, settings.urls.base_ui)
         
         saved_link = page.locator(SIDEBAR.SAVED_LINK)
         saved_link.click()
@@ -106,7 +109,7 @@ class TestSidebarNavigation:
         Verify clicking 'Nhóm' link navigates to communities.
         """
         page = logged_in_page
-        page.goto(settings.urls.base_ui)
+        ensure_at(page, settings.urls.base_ui)
         
         communities_link = page.locator(SIDEBAR.COMMUNITIES_LINK)
         communities_link.click()
@@ -118,7 +121,12 @@ class TestSidebarNavigation:
 @pytest.mark.ui
 @pytest.mark.navigation
 class TestSidebarToggle:
-    """Sidebar toggle (open/close) tests."""
+    """
+    Sidebar toggle (open/close) tests.
+    
+    Uses the function-scoped `page`: these tests change sidebar state (which
+    the app may persist), so they must not share a page.
+    """
     
     def test_sidebar_can_be_closed(self, page: Page):
         """
@@ -180,7 +188,7 @@ class TestCreatePostNavigation:
         Verify clicking 'Tạo bài viết' opens the post editor.
         """
         page = logged_in_page
-        page.goto(settings.urls.base_ui)
+        ensure_at(page, settings.urls.base_ui)
         
         create_btn = page.locator(SIDEBAR.CREATE_POST_BUTTON)
         
@@ -207,14 +215,6 @@ class TestCreatePostNavigation:
         # Try to access create post page directly without auth
         page.goto(f"{settings.urls.base_ui}/create")
         
-        # Should redirect to login or show login prompt
-        try:
-            page.wait_for_url("**/login**", timeout=5000)
-            logger.info("✅ Redirected to login (correct behavior)")
-        except Exception:
-            # Check if login modal appeared or access denied
-            current_url = page.url
-            if "/login" in current_url or "/auth" in current_url:
-                logger.info("✅ Auth required correctly")
-            else:
-                logger.warning("⚠️ May allow unauthenticated access")
+        # Should redirect to login or auth page (single auto-retrying assertion)
+        expect(page).to_have_url(re.compile(r"/(login|auth)"), timeout=5000)
+        logger.info("✅ Redirected to login (correct behavior)")
@@ -10,16 +10,24 @@ Strategy:
 - Test voting interactions
 """
 
+import re
 import pytest
-from playwright.sync_api import Page, expect
+from playwright.sync_api import Locator, Page, expect
 from pages.newsfeed_page import NewsfeedPage
 from pages.locators.newsfeed_locators import NEWSFEED, EMOJI_PICKER
 from pages.locators.postcard_locators import POST_CARD
 from core.logger import log
+from tests.helpers.wait import wait_after_action
 from config.settings import settings
 
 logger = log()
 
+# Guarantee posts exist (seeded via API) before any newsfeed UI check
+pytestmark = pytest.mark.usefixtures("seeded_newsfeed")
+
+# Post details URL (compiled once)
+POST_URL_RE = re.compile(r"/post/[^/]+")
+
 
 @pytest.mark.ui
 @pytest.mark.newsfeed
@@ -32,7 +40,7 @@ class TestNewsfeedLoad:
         Test ID: FEED-001
         Verify newsfeed page loads successfully.
         """
-        newsfeed = NewsfeedPage(page)
+        newsfeed = NewsfeedPage.for_page(page)
         newsfeed.open()
         
         assert newsfeed.is_posts_container_visible(), \
@@ -43,7 +51,7 @@ class TestNewsfeedLoad:
         Test ID: FEED-002
         Verify newsfeed displays at least one post.
         """
-        newsfeed = NewsfeedPage(page)
+        newsfeed = NewsfeedPage.for_page(page)
         newsfeed.open()
         
         post_count = newsfeed.get_post_count()
@@ -66,45 +74,24 @@ class TestNewsfeedLoad:
 class TestPostCardElements:
     """Post card UI elements tests."""
     
-    def test_post_card_has_title(self, page: Page):
-        """
-        Test ID: FEED-010
-        Verify post card displays title.
-        """
-        newsfeed = NewsfeedPage(page)
-        newsfeed.open()
-        
-        first_post = newsfeed.get_first_post_card()
-        title = first_post.locator(POST_CARD.TITLE)
-        
-        expect(title).to_be_visible()
-        title_text = title.text_content()
-        assert len(title_text.strip()) > 0, "Title should not be empty"
-    
-    def test_post_card_has_author_info(self, page: Page):
+    def test_post_card_elements_visible(self, loaded_newsfeed: NewsfeedPage):
         """
-        Test ID: FEED-011
-        Verify post card displays author information.
+        Test ID: FEED-010, FEED-011, FEED-013, FEED-020, FEED-021, FEED-030, FEED-031, FEED-040
+        Verify post card displays title, author, timestamp and action buttons.
         """
-        newsfeed = NewsfeedPage(page)
-        newsfeed.open()
-        
-        first_post = newsfeed.get_first_post_card()
-        # Use .first because repost cards may have 2 author names
-        author = first_post.locator(POST_CARD.AUTHOR_NAME).first
+        card = loaded_newsfeed.snapshot_first_card()
+        assert card, "First post card should be rendered"
         
-        expect(author).to_be_visible()
-        logger.info("✅ Author info displayed on post card")
+        required = ["title", "author", "timestamp", "upvote", "downvote", "save", "share", "emoji"]
+        missing = [name for name in required if not card[name]]
+        assert not missing, f"Post card elements not visible: {missing}"
+        assert card["title_text"], "Title should not be empty"
     
-    def test_post_card_has_thumbnail(self, page: Page):
+    def test_post_card_has_thumbnail(self, first_post: Locator):
         """
         Test ID: FEED-012
         Verify post card displays thumbnail image.
         """
-        newsfeed = NewsfeedPage(page)
-        newsfeed.open()
-        
-        first_post = newsfeed.get_first_post_card()
         thumbnail = first_post.locator(POST_CARD.THUMBNAIL_IMAGE)
         
         # Thumbnail may or may not be present
@@ -112,20 +99,6 @@ class TestPostCardElements:
             logger.info("✅ Thumbnail image displayed")
         else:
             logger.info("ℹ️ No thumbnail on this post (may be text-only)")
-    
-    def test_post_card_has_timestamp(self, page: Page):
-        """
-        Test ID: FEED-013
-        Verify post card displays timestamp.
-        """
-        newsfeed = NewsfeedPage(page)
-        newsfeed.open()
-        
-        first_post = newsfeed.get_first_post_card()
-        timestamp = first_post.locator(POST_CARD.TIMESTAMP)
-        
-        expect(timestamp).to_be_visible()
-        logger.info("✅ Timestamp displayed on post card")
 
 
 @pytest.mark.ui
@@ -134,40 +107,12 @@ class TestPostCardElements:
 class TestPostCardVoting:
     """Post card voting interaction tests."""
     
-    def test_upvote_button_visible(self, page: Page):
-        """
-        Test ID: FEED-020
-        Verify upvote button is visible on post card.
-        """
-        newsfeed = NewsfeedPage(page)
-        newsfeed.open()
-        
-        first_post = newsfeed.get_first_post_card()
-        upvote_btn = first_post.locator(POST_CARD.UPVOTE_BUTTON)
-        
-        expect(upvote_btn).to_be_visible()
-        logger.info("✅ Upvote button visible")
-    
-    def test_downvote_button_visible(self, page: Page):
-        """
-        Test ID: FEED-021
-        Verify downvote button is visible on post card.
-        """
-        newsfeed = NewsfeedPage(page)
-        newsfeed.open()
-        
-        first_post = newsfeed.get_first_post_card()
-        downvote_btn = first_post.locator(POST_CARD.DOWNVOTE_BUTTON)
-        
-        expect(downvote_btn).to_be_visible()
-        logger.info("✅ Downvote button visible")
-    
     def test_click_upvote_requires_login(self, page: Page):
         """
         Test ID: FEED-022
         Verify clicking upvote without login prompts for login.
         """
-        newsfeed = NewsfeedPage(page)
+        newsfeed = NewsfeedPage.for_page(page)
         newsfeed.open()
         
         first_post = newsfeed.get_first_post_card()
@@ -176,19 +121,19 @@ class TestPostCardVoting:
         upvote_btn.click()
         
         # Should show login prompt or redirect
-        page.wait_for_timeout(1000)
+        wait_after_action(page)
         current_url = page.url
         
         # Either redirected to login or modal appeared
         logger.info(f"ℹ️ After upvote click (unauthenticated): {current_url}")
     
-    def test_logged_in_user_can_upvote(self, logged_in_page: Page):
+    def test_logged_in_user_can_upvote(self, newsfeed_page: NewsfeedPage):
         """
         Test ID: FEED-023
         Verify logged-in user can upvote a post.
         """
-        page = logged_in_page
-        newsfeed = NewsfeedPage(page)
+        newsfeed = newsfeed_page
+        page = newsfeed.page
         newsfeed.open()
         
         first_post = newsfeed.get_first_post_card()
@@ -198,7 +143,7 @@ class TestPostCardVoting:
         # vote_count = first_post.locator(POST_CARD.VOTE_COUNT)
         
         upvote_btn.click()
-        page.wait_for_timeout(1000)
+        wait_after_action(page)
         
         logger.info("✅ Upvote clicked (verify vote count changed)")
 
@@ -209,48 +154,20 @@ class TestPostCardVoting:
 class TestPostCardActions:
     """Post card action buttons tests."""
     
-    def test_save_button_visible(self, page: Page):
-        """
-        Test ID: FEED-030
-        Verify save/bookmark button is visible.
-        """
-        newsfeed = NewsfeedPage(page)
-        newsfeed.open()
-        
-        first_post = newsfeed.get_first_post_card()
-        save_btn = first_post.locator(POST_CARD.SAVE_BUTTON)
-        
-        expect(save_btn).to_be_visible()
-        logger.info("✅ Save button visible")
-    
-    def test_share_button_visible(self, page: Page):
-        """
-        Test ID: FEED-031
-        Verify share/repost button is visible.
-        """
-        newsfeed = NewsfeedPage(page)
-        newsfeed.open()
-        
-        first_post = newsfeed.get_first_post_card()
-        share_btn = first_post.locator(POST_CARD.SHARE_BUTTON)
-        
-        expect(share_btn).to_be_visible()
-        logger.info("✅ Share button visible")
-    
-    def test_logged_in_user_can_save_post(self, logged_in_page: Page):
+    def test_logged_in_user_can_save_post(self, newsfeed_page: NewsfeedPage):
         """
         Test ID: FEED-032
         Verify logged-in user can save a post.
         """
-        page = logged_in_page
-        newsfeed = NewsfeedPage(page)
+        newsfeed = newsfeed_page
+        page = newsfeed.page
         newsfeed.open()
         
         first_post = newsfeed.get_first_post_card()
         save_btn = first_post.locator(POST_CARD.SAVE_BUTTON)
         
         save_btn.click()
-        page.wait_for_timeout(1000)
+        wait_after_action(page)
         
         # Save button should toggle state
         logger.info("✅ Save button clicked")
@@ -262,27 +179,13 @@ class TestPostCardActions:
 class TestEmojiReactions:
     """Post emoji reaction tests."""
     
-    def test_add_emoji_button_visible(self, page: Page):
-        """
-        Test ID: FEED-040
-        Verify add emoji button is visible on post card.
-        """
-        newsfeed = NewsfeedPage(page)
-        newsfeed.open()
-        
-        first_post = newsfeed.get_first_post_card()
-        add_emoji_btn = first_post.locator(POST_CARD.ADD_EMOJI_BUTTON)
-        
-        expect(add_emoji_btn).to_be_visible()
-        logger.info("✅ Add emoji button visible")
-    
-    def test_click_emoji_opens_picker(self, logged_in_page: Page):
+    def test_click_emoji_opens_picker(self, newsfeed_page: NewsfeedPage):
         """
         Test ID: FEED-041
         Verify clicking add emoji button opens emoji picker.
         """
-        page = logged_in_page
-        newsfeed = NewsfeedPage(page)
+        newsfeed = newsfeed_page
+        page = newsfeed.page
         newsfeed.open()
         
         first_post = newsfeed.get_first_post_card()
@@ -293,12 +196,11 @@ class TestEmojiReactions:
         # Wait for emoji picker
         emoji_dialog = page.locator(EMOJI_PICKER.DIALOG)
         
-        try:
-            emoji_dialog.wait_for(state="visible", timeout=5000)
+        if newsfeed.is_visible_slow(emoji_dialog, timeout=2000):
             logger.info("✅ Emoji picker opened")
-            emoji_dialog.click(EMOJI_PICKER.FIRST_EMOJI)  # first emoji
-            logger.info("✅ Thả Emoji selected")
-        except Exception:
+            # Close without selecting: reacting would mutate the shared seeded post
+            page.keyboard.press("Escape")
+        else:
             logger.info("ℹ️ Emoji picker may have different implementation")
 
 
@@ -312,7 +214,7 @@ class TestNewsfeedScroll:
         Test ID: FEED-050
         Verify scrolling loads more posts (infinite scroll).
         """
-        newsfeed = NewsfeedPage(page)
+        newsfeed = NewsfeedPage.for_page(page)
         newsfeed.open()
         
         initial_count = newsfeed.get_post_count()
@@ -341,28 +243,15 @@ class TestPostCardNavigation:
         Test ID: FEED-060
         Verify clicking post card navigates to post details page.
         """
-        newsfeed = NewsfeedPage(page)
+        newsfeed = NewsfeedPage.for_page(page)
         newsfeed.open()
         
-        # Click on post content link (not action buttons)
+        # Click on post content link (not action buttons), title as fallback
         first_post = newsfeed.get_first_post_card()
         content_link = first_post.locator(POST_CARD.CONTENT_LINK)
+        target = content_link if content_link.count() > 0 else first_post.locator(POST_CARD.TITLE)
         
-        if content_link.is_visible():
-            content_link.click()
-            
-            try:
-                page.wait_for_url("**/post/**", timeout=10000)
-                logger.info("✅ Navigated to post details")
-            except Exception:
-                logger.info("ℹ️ Navigation may have different URL pattern")
-        else:
-            # Try clicking title
-            title_link = first_post.locator(POST_CARD.TITLE)
-            title_link.click()
-            
-            try:
-                page.wait_for_url("**/post/**", timeout=10000)
-                logger.info("✅ Navigated to post details via title")
-            except Exception:
-                logger.info("ℹ️ Navigation pattern may differ")
+        target.click()
+        
+        expect(page).to_have_url(POST_URL_RE, timeout=5000)
+        logger.info("✅ Navigated to post details")
@@ -9,12 +9,17 @@ Strategy:
 - Test interactions (upvote, downvote, save, repost)
 """
 
+import re
 import pytest
-from playwright.sync_api import Page
+from playwright.sync_api import Page, expect
 from pages.newsfeed_page import NewsfeedPage
 from pages.post_details_page import PostDetailsPage
+from pages.locators.postcard_locators import POST_CARD
+from tests.helpers.wait import wait_after_action
 from utils.api_client import BlogAPIClient
-from utils.data_builder import PostBuilder
+
+# Upvote button active state (same classes PostDetailsPage.is_upvote_active checks)
+UPVOTE_ACTIVE_CLASS = re.compile(r"active|voted")
 
 
 @pytest.mark.skip(reason="UI selectors need to be updated after inspecting actual frontend HTML")
@@ -39,7 +44,7 @@ class TestPostCreation:
         page = logged_in_page
         
         # Navigate to newsfeed
-        newsfeed = NewsfeedPage(page)
+        newsfeed = NewsfeedPage.for_page(page)
         newsfeed.open()
         
         # Get all post titles
@@ -59,7 +64,7 @@ class TestPostCreation:
         Test post count increases after creating a post.
         """
         page = logged_in_page
-        newsfeed = NewsfeedPage(page)
+        newsfeed = NewsfeedPage.for_page(page)
         newsfeed.open()
         
         # Get initial count
@@ -73,14 +78,11 @@ class TestPostCreation:
         response = api_as_user.posts.create_post(post_data.to_dict())
         assert response.success, "Post creation failed"
         
-        # Refresh page
+        # Soft re-fetch when available, else domcontentloaded reload
         newsfeed.refresh()
-        newsfeed.wait_for_posts_to_load()
         
-        # Verify count increased
-        new_count = newsfeed.get_post_count()
-        assert new_count > initial_count, \
-            f"Post count should increase from {initial_count} to {new_count}"
+        # Verify count increased (auto-retrying, exits as soon as the new card renders)
+        expect(page.locator(POST_CARD.CARD)).to_have_count(initial_count + 1, timeout=10000)
 
 
 @pytest.mark.ui
@@ -91,7 +93,7 @@ class TestPostDetails:
     def test_view_post_details(
         self,
         logged_in_page: Page,
-        test_post: dict
+        test_post_readonly: dict
     ):
         """
         Test ID: POST-010
@@ -101,19 +103,19 @@ class TestPostDetails:
         post_page = PostDetailsPage(page)
         
         # Open post details
-        post_page.open_post(test_post["id"])
+        post_page.open_post(test_post_readonly["id"])
         
         # Verify post content
         assert post_page.is_post_visible(), "Post should be visible"
         
         title = post_page.get_post_title()
-        assert test_post["title"] in title, \
-            f"Title should match: expected '{test_post['title']}', got '{title}'"
+        assert test_post_readonly["title"] in title, \
+            f"Title should match: expected '{test_post_readonly['title']}', got '{title}'"
     
     def test_post_details_shows_author_info(
         self,
         logged_in_page: Page,
-        test_post: dict
+        test_post_readonly: dict
     ):
         """
         Test ID: POST-011
@@ -122,7 +124,7 @@ class TestPostDetails:
         page = logged_in_page
         post_page = PostDetailsPage(page)
         
-        post_page.open_post(test_post["id"])
+        post_page.open_post(test_post_readonly["id"])
         
         # Verify author section visible
         author_name = post_page.get_author_name()
@@ -158,13 +160,12 @@ class TestPostVoting:
         
         # Click upvote
         post_page.upvote_post()
+        wait_after_action(page)
         
-        # Wait for update
-        page.wait_for_timeout(1000)
-        
-        # Verify upvote button is active
+        # Verify upvote button is active (polls instead of sleeping)
         # (This depends on frontend implementation - adjust selector)
-        assert post_page.is_upvote_active(), "Upvote button should be in active state"
+        upvote_btn = page.locator(POST_CARD.UPVOTE_BUTTON)
+        expect(upvote_btn).to_have_class(UPVOTE_ACTIVE_CLASS, timeout=3000)
     
     def test_toggle_upvote(
         self,
@@ -180,16 +181,18 @@ class TestPostVoting:
         
         post_page.open_post(test_post["id"])
         
+        upvote_btn = page.locator(POST_CARD.UPVOTE_BUTTON)
+        
         # Upvote
         post_page.upvote_post()
-        page.wait_for_timeout(500)
+        expect(upvote_btn).to_have_class(UPVOTE_ACTIVE_CLASS, timeout=3000)
         
         # Upvote again (toggle off)
         post_page.upvote_post()
-        page.wait_for_timeout(500)
+        wait_after_action(page)
         
         # Verify not active
-        assert not post_page.is_upvote_active(), "Upvote should be toggled off"
+        expect(upvote_btn).not_to_have_class(UPVOTE_ACTIVE_CLASS, timeout=3000)
     
     def test_downvote_post(
         self,
@@ -208,7 +211,7 @@ class TestPostVoting:
         # Click downvote
         post_page.downvote_post()
         
-        page.wait_for_timeout(1000)
+        wait_after_action(page)
         
         # Verify downvote registered
         # (Add assertions based on frontend implementation)
@@ -237,7 +240,7 @@ class TestPostSaving:
         # Click save button
         post_page.save_post()
         
-        page.wait_for_timeout(1000)
+        wait_after_action(page)
         
         # Verify save button state changed (implementation-dependent)
         # Could check if button text changed to "Saved" or icon changed
@@ -267,114 +270,7 @@ class TestRepost:
         # Click repost
         post_page.click_repost()
         
-        page.wait_for_timeout(1500)
+        wait_after_action(page)
         
         # Verify repost action completed
         # (Check if confirmation modal appears or redirect happens)
-
-
-@pytest.mark.api
-@pytest.mark.posts
-class TestPostAPI:
-    """API-level post tests."""
-    
-    def test_create_post_via_api(self, api_as_user: BlogAPIClient):
-        """
-        Test ID: POST-API-001
-        Test creating post via API.
-        """
-        user_id = api_as_user._test_user["id"]
-        
-        post_data = PostBuilder() \
-            .with_author(user_id) \
-            .with_title("Test Post via API") \
-            .add_text_block("This is a test post") \
-            .build()
-        
-        response = api_as_user.posts.create_post(post_data.to_dict())
-        
-        assert response.success, f"Post creation failed: {response.data}"
-        assert response.status_code in [200, 201]
-        
-        # Verify response contains post ID
-        post_id = response.json.get("data", {}).get("id")
-        assert post_id is not None, "Response should contain post ID"
-    
-    def test_get_post_by_id(self, api_as_user: BlogAPIClient, test_post: dict):
-        """
-        Test ID: POST-API-002
-        Test retrieving post by ID via API.
-        """
-        response = api_as_user.posts.get_post(test_post["id"])
-        
-        assert response.success, "Should retrieve post successfully"
-        
-        data = response.json.get("data", {})
-        assert data.get("id") == test_post["id"]
-        assert data.get("title") == test_post["title"]
-    
-    def test_update_post(self, api_as_user: BlogAPIClient, test_post: dict):
-        """
-        Test ID: POST-API-003
-        Test updating post via API.
-        """
-        new_title = "Updated Title"
-        
-        response = api_as_user.posts.update_post(
-            test_post["id"],
-            {"title": new_title}
-        )
-        
-        assert response.success, "Update should succeed"
-        
-        # Verify update
-        get_response = api_as_user.posts.get_post(test_post["id"])
-        updated_title = get_response.json.get("data", {}).get("title")
-        assert updated_title == new_title, "Title should be updated"
-    
-    def test_delete_post(self, api_as_user: BlogAPIClient):
-        """
-        Test ID: POST-API-004
-        Test deleting post via API.
-        """
-        # Create a post
-        from utils.data_builder import create_quick_post
-        user_id = api_as_user._test_user["id"]
-        post_data = create_quick_post(user_id)
-        
-        create_resp = api_as_user.posts.create_post(post_data.to_dict())
-        post_id = create_resp.json.get("data", {}).get("id")
-        
-        # Delete it
-        delete_resp = api_as_user.posts.delete_post(post_id)
-        assert delete_resp.success, "Delete should succeed"
-        
-        # Verify deleted (404 when trying to get)
-        get_resp = api_as_user.posts.get_post(post_id)
-        assert get_resp.status_code == 404, "Post should not exist after deletion"
-
-
-@pytest.mark.regression
-@pytest.mark.slow
-def test_multiple_posts_creation_performance(api_as_user: BlogAPIClient):
-    """
-    Test ID: POST-PERF-001
-    Test creating multiple posts in sequence.
-    
-    Performance benchmark: Should create 10 posts in < 5 seconds via API.
-    """
-    import time
-    from utils.data_builder import create_quick_post
-    
-    user_id = api_as_user._test_user["id"]
-    
-    start_time = time.time()
-    
-    for i in range(10):
-        post_data = create_quick_post(user_id)
-        response = api_as_user.posts.create_post(post_data.to_dict())
-        assert response.success, f"Post {i+1} creation failed"
-    
-    elapsed = time.time() - start_time
-    
-    assert elapsed < 5.0, f"Creating 10 posts took {elapsed:.2f}s, should be < 5s"
@@ -9,74 +9,67 @@ Strategy:
 - Test tab switching (Posts, Communities)
 """
 
+import re
 import pytest
 from playwright.sync_api import Page, expect
 from pages.locators.profile_locators import PROFILE
+from pages.locators.postcard_locators import POST_CARD
+from pages.profile_page import ProfilePage
 from core.logger import log
+from tests.helpers.navigation import ensure_at
 from config.settings import settings
 
 logger = log()
 
+# Resolved once at import
+BASE_UI = settings.urls.base_ui
+
+# DOM/text-only assertions - skip images, fonts and analytics on every goto
+pytestmark = pytest.mark.block_resources
+
 
 @pytest.mark.ui
 @pytest.mark.profile
 class TestProfilePageElements:
     """Profile page UI elements tests."""
     
-    def test_profile_displays_user_name(self, logged_in_page: Page, auth_user: dict):
+    def test_profile_displays_user_name(self, profile_page: Page):
         """
         Test ID: PROFILE-001
         Verify profile page displays user's display name.
         """
-        page = logged_in_page
-        user_id = auth_user.get("id")
-        
-        # Navigate to profile
-        page.goto(f"{settings.urls.base_ui}/profile/{user_id}")
-        
-        display_name = page.locator(PROFILE.DISPLAY_NAME)
+        display_name = ProfilePage(profile_page).display_name
         expect(display_name).to_be_visible(timeout=10000)
-        
-        name_text = display_name.text_content()
-        assert len(name_text.strip()) > 0, "Display name should not be empty"
-        logger.info(f"✅ Profile name displayed: {name_text}")
+        # Auto-retrying: tolerates the name rendering after the element
+        expect(display_name).not_to_have_text("", timeout=5000)
+        logger.info("✅ Profile name displayed")
     
-    def test_profile_displays_avatar(self, logged_in_page: Page, auth_user: dict):
+    def test_profile_displays_avatar(self, profile_page: Page):
         """
         Test ID: PROFILE-002
         Verify profile page displays user's avatar.
         """
-        page = logged_in_page
-        user_id = auth_user.get("id")
-        
-        page.goto(f"{settings.urls.base_ui}/profile/{user_id}")
-        
-        avatar = page.locator(PROFILE.PROFILE_AVATAR)
+        avatar = ProfilePage(profile_page).avatar
         expect(avatar).to_be_visible(timeout=10000)
         logger.info("✅ Profile avatar displayed")
     
-    def test_profile_shows_follower_stats(self, logged_in_page: Page, auth_user: dict):
+    def test_profile_shows_follower_stats(self, profile_page: Page):
         """
         Test ID: PROFILE-003
         Verify profile shows follower/following statistics.
         """
-        page = logged_in_page
-        user_id = auth_user.get("id")
-        
-        page.goto(f"{settings.urls.base_ui}/profile/{user_id}")
-        
-        # Check followers stat
-        followers_stat = page.locator(PROFILE.STAT_FOLLOWERS)
-        try:
-            followers_stat.wait_for(state="visible", timeout=10000)
-            followers_text = followers_stat.text_content()
-            logger.info(f"✅ Followers count: {followers_text}")
-        except Exception:
+        # Check followers stat (informational - short probe, page already loaded)
+        profile = ProfilePage(profile_page)
+        if profile.is_visible_slow(profile.followers_stat, timeout=1000):
+            followers_text = profile.followers_stat.text_content()
+            logger.info("✅ Followers count: %s", followers_text)
+        else:
             logger.info("ℹ️ Followers stat may have different selector")
 
 
 @pytest.mark.ui
 @pytest.mark.profile
+@pytest.mark.xdist_group("profile_user")
 class TestProfileTabs:
     """Profile tabs navigation tests."""
     
@@ -88,15 +81,16 @@ class TestProfileTabs:
         page = logged_in_page
         user_id = auth_user.get("id")
         
-        page.goto(f"{settings.urls.base_ui}/profile/{user_id}")
+        profile = ProfilePage(page)
+        profile.open_user_profile(user_id)
         
-        posts_tab = page.locator(PROFILE.TAB_POSTS)
+        posts_tab = profile.posts_tab
         expect(posts_tab).to_be_visible(timeout=10000)
         
         # Check if active class is present
         tab_class = posts_tab.get_attribute("class") or ""
         # Active tab should have specific styling
-        logger.info(f"✅ Posts tab visible, class: {tab_class}")
+        logger.info("✅ Posts tab visible, class: %s", tab_class)
     
     def test_click_communities_tab(self, logged_in_page: Page, auth_user: dict):
         """
@@ -106,17 +100,16 @@ class TestProfileTabs:
         page = logged_in_page
         user_id = auth_user.get("id")
         
-        page.goto(f"{settings.urls.base_ui}/profile/{user_id}")
+        profile = ProfilePage(page)
+        profile.open_user_profile(user_id)
         
-        communities_tab = page.locator(PROFILE.TAB_COMMUNITIES)
+        communities_tab = profile.communities_tab
         
         if communities_tab.is_visible():
             communities_tab.click()
             
-            # Wait for tab content to update
-            page.wait_for_timeout(1000)
-            
-            # Tab should now be active
+            # Tab should now be active (auto-retrying, no fixed sleep)
+            expect(communities_tab).to_have_class(re.compile(PROFILE.TAB_ACTIVE_CLASS), timeout=5000)
             logger.info("✅ Switched to communities tab")
         else:
             pytest.skip("Communities tab not visible")
@@ -129,19 +122,19 @@ class TestProfileTabs:
         page = logged_in_page
         user_id = auth_user.get("id")
         
-        page.goto(f"{settings.urls.base_ui}/profile/{user_id}")
+        profile = ProfilePage(page)
+        profile.open_user_profile(user_id)
         
-        tab_content = page.locator(PROFILE.TAB_CONTENT)
-        expect(tab_content).to_be_visible(timeout=10000)
+        expect(profile.tab_content).to_be_visible(timeout=10000)
         
         # Check for post cards
-        post_cards = page.locator(PROFILE.POST_CARD)
-        post_count = post_cards.count()
-        logger.info(f"✅ Found {post_count} posts on profile")
+        post_count = profile.post_cards.count()
+        logger.info("✅ Found %d posts on profile", post_count)
 
 
 @pytest.mark.ui
 @pytest.mark.profile
+@pytest.mark.xdist_group("profile_user")
 class TestProfileNavigation:
     """Profile access via navigation tests."""
     
@@ -151,24 +144,25 @@ class TestProfileNavigation:
         Verify user can access profile via header avatar menu.
         """
         page = logged_in_page
-        page.goto(settings.urls.base_ui)
+        ensure_at(page, BASE_UI)
+        
+        profile = ProfilePage(page)
         
         # Click avatar button
-        avatar_btn = page.locator(PROFILE.HEADER_AVATAR_BTN)
+        avatar_btn = profile.header_avatar_btn
         
         if avatar_btn.is_visible():
             avatar_btn.click()
             
-            # Click view profile menu item
-            view_profile = page.locator(PROFILE.VIEW_PROFILE_MENU_ITEM)
+            # Click view profile menu item (menu opens instantly - short probe)
+            view_profile = profile.view_profile_menu_item
             
-            try:
-                view_profile.wait_for(state="visible", timeout=3000)
+            if profile.is_visible_slow(view_profile, timeout=1000):
                 view_profile.click()
                 
                 page.wait_for_url("**/profile/**", timeout=5000)
                 logger.info("✅ Navigated to profile via menu")
-            except Exception:
+            else:
                 logger.info("ℹ️ Profile menu may have different structure")
         else:
             pytest.skip("Header avatar not visible")
@@ -176,10 +170,21 @@ class TestProfileNavigation:
 
 @pytest.mark.ui
 @pytest.mark.profile
+@pytest.mark.xdist_group("profile_user")
 class TestProfilePostCard:
-    """Profile post card interaction tests."""
+    """
+    Profile post card interaction tests.
+    
+    `test_post_readonly` guarantees the logged-in user has at least one post
+    (same account), so these tests assert instead of skipping on empty profiles.
+    """
     
-    def test_click_post_navigates_to_details(self, logged_in_page: Page, auth_user: dict):
+    def test_click_post_navigates_to_details(
+        self,
+        logged_in_page: Page,
+        auth_user: dict,
+        test_post_readonly: dict
+    ):
         """
         Test ID: PROFILE-030
         Verify clicking a post card navigates to post details.
@@ -187,22 +192,22 @@ class TestProfilePostCard:
         page = logged_in_page
         user_id = auth_user.get("id")
         
-        page.goto(f"{settings.urls.base_ui}/profile/{user_id}")
+        profile = ProfilePage(page)
+        profile.open_user_profile(user_id)
         
-        post_card = page.locator(PROFILE.POST_CARD).first
+        post_card = profile.post_cards.first
+        expect(post_card).to_be_visible(timeout=10000)
+        post_card.click()
         
-        if post_card.is_visible():
-            post_card.click()
-            
-            try:
-                page.wait_for_url("**/post/**", timeout=5000)
-                logger.info("✅ Navigated to post details")
-            except Exception:
-                logger.info("ℹ️ Post detail navigation may differ")
-        else:
-            pytest.skip("No posts found on profile")
+        expect(page).to_have_url(re.compile(r"/post/"), timeout=5000)
+        logger.info("✅ Navigated to post details")
     
-    def test_first_post_title_is_displayed(self, logged_in_page: Page, auth_user: dict):
+    def test_first_post_title_is_displayed(
+        self,
+        logged_in_page: Page,
+        auth_user: dict,
+        test_post_readonly: dict
+    ):
         """
         Test ID: PROFILE-031
         Verify first post displays its title correctly.
@@ -210,19 +215,10 @@ class TestProfilePostCard:
         page = logged_in_page
         user_id = auth_user.get("id")
         
-        page.goto(f"{settings.urls.base_ui}/profile/{user_id}")
-        
-        post_cards = page.locator(PROFILE.POST_CARD)
+        profile = ProfilePage(page)
+        profile.open_user_profile(user_id)
         
-        if post_cards.count() > 0:
-            from pages.locators.postcard_locators import POST_CARD
-            first_title = post_cards.first.locator(POST_CARD.TITLE)
-            
-            if first_title.is_visible():
-                title_text = first_title.text_content()
-                assert len(title_text.strip()) > 0, "Post title should not be empty"
-                logger.info(f"✅ First post title: {title_text}")
-            else:
-                logger.info("ℹ️ Title element not visible")
-        else:
-            pytest.skip("No posts on profile to check")
+        first_title = profile.post_cards.first.locator(POST_CARD.TITLE)
+        expect(first_title).to_be_visible(timeout=10000)
+        expect(first_title).not_to_have_text("", timeout=5000)
+        logger.info("✅ First post title displayed")
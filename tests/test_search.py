@@ -11,12 +11,20 @@ Strategy:
 
 import pytest
 from playwright.sync_api import Page, expect
-from pages.locators.search_locators import SEARCH
+from pages.search_page import SearchPage
 from core.logger import log
+from tests.helpers.navigation import ensure_at
+from tests.helpers.wait import wait_after_action
 from config.settings import settings
 
 logger = log()
 
+# Resolved once at import
+BASE_UI = settings.urls.base_ui
+
+# DOM/text-only assertions - skip images, fonts and analytics on every goto
+pytestmark = pytest.mark.block_resources
+
 
 @pytest.mark.ui
 @pytest.mark.search
@@ -28,22 +36,22 @@ class TestSearchBar:
         Test ID: SEARCH-001
         Verify search input is visible on the homepage.
         """
-        page.goto(settings.urls.base_ui)
+        page.goto(BASE_UI)
         
-        search_input = page.locator(SEARCH.SEARCH_INPUT)
-        expect(search_input).to_be_visible(timeout=10000)
+        search = SearchPage(page)
+        expect(search.search_input).to_be_visible(timeout=10000)
         
     def test_search_input_accepts_text(self, page: Page):
         """
         Test ID: SEARCH-002
         Verify search input accepts typed text.
         """
-        page.goto(settings.urls.base_ui)
+        page.goto(BASE_UI)
         
-        search_input = page.locator(SEARCH.SEARCH_INPUT)
-        search_input.fill("test search query")
+        search = SearchPage(page)
+        search.search_input.fill("test search query")
         
-        expect(search_input).to_have_value("test search query")
+        expect(search.search_input).to_have_value("test search query")
     
     def test_search_suggestions_appear_on_typing(self, page: Page):
         """
@@ -52,21 +60,15 @@ class TestSearchBar:
         
         Note: This test may need adjustment based on actual API response.
         """
-        page.goto(settings.urls.base_ui)
-        
-        search_input = page.locator(SEARCH.SEARCH_INPUT)
-        search_input.fill("test")
+        page.goto(BASE_UI)
         
-        # Wait for suggestions (API response)
-        suggestions_dropdown = page.locator(SEARCH.SUGGESTIONS_DROPDOWN)
+        search = SearchPage(page)
+        search.search_input.fill("test")
         
-        # Suggestions may or may not appear based on matching content
-        # Use soft assertion - log result rather than fail
-        try:
-            suggestions_dropdown.wait_for(state="visible", timeout=5000)
-            logger.info("✅ Suggestions dropdown appeared")
-        except Exception:
-            logger.info("ℹ️ No suggestions appeared (may be expected if no matching content)")
+        # Wait for the debounced suggestions request, then assert
+        wait_after_action(page)
+        expect(search.suggestions).to_be_visible(timeout=2000)
+        logger.info("✅ Suggestions dropdown appeared")
 
 
 @pytest.mark.ui
@@ -74,46 +76,27 @@ class TestSearchBar:
 class TestSearchSuggestions:
     """Search suggestions dropdown tests."""
     
-    def test_post_suggestion_button_present(self, logged_in_page: Page):
+    @pytest.mark.parametrize("query,button", [
+        pytest.param("automation", "suggest_post_btn", id="post"),
+        pytest.param("test", "suggest_user_btn", id="user"),
+    ])
+    def test_suggestion_button_present(self, logged_in_page: Page, query: str, button: str):
         """
-        Test ID: SEARCH-010
-        Verify 'Bài viết có chứa' suggestion option exists.
+        Test ID: SEARCH-010, SEARCH-011
+        Verify 'Bài viết có chứa' / 'Người dùng tên' suggestion options exist.
         """
         page = logged_in_page
-        page.goto(settings.urls.base_ui)
+        ensure_at(page, BASE_UI)
         
-        search_input = page.locator(SEARCH.SEARCH_INPUT)
-        search_input.fill("automation")
+        search = SearchPage(page)
+        search.search_input.fill(query)
         
         # Wait for dropdown
-        suggestions = page.locator(SEARCH.SUGGESTIONS_DROPDOWN)
-        try:
-            suggestions.wait_for(state="visible", timeout=5000)
-            post_btn = page.locator(SEARCH.SUGGEST_POST_BTN)
-            expect(post_btn).to_be_visible()
-            logger.info("✅ Post suggestion button found")
-        except Exception:
-            pytest.skip("Suggestions dropdown not appearing - check API/content")
-    
-    def test_user_suggestion_button_present(self, logged_in_page: Page):
-        """
-        Test ID: SEARCH-011
-        Verify 'Người dùng tên' suggestion option exists.
-        """
-        page = logged_in_page
-        page.goto(settings.urls.base_ui)
-        
-        search_input = page.locator(SEARCH.SEARCH_INPUT)
-        search_input.fill("test")
-        
-        suggestions = page.locator(SEARCH.SUGGESTIONS_DROPDOWN)
-        try:
-            suggestions.wait_for(state="visible", timeout=5000)
-            user_btn = page.locator(SEARCH.SUGGEST_USER_BTN)
-            expect(user_btn).to_be_visible()
-            logger.info("✅ User suggestion button found")
-        except Exception:
-            pytest.skip("Suggestions dropdown not appearing")
+        wait_after_action(page)
+        expect(search.suggestions).to_be_visible(timeout=2000)
+        
+        expect(getattr(search, button)).to_be_visible()
+        logger.info("✅ Suggestion button found: %s", button)
     
     def test_click_post_suggestion_navigates(self, logged_in_page: Page):
         """
@@ -121,22 +104,20 @@ class TestSearchSuggestions:
         Verify clicking post suggestion navigates to search results.
         """
         page = logged_in_page
-        page.goto(settings.urls.base_ui)
-        
-        search_input = page.locator(SEARCH.SEARCH_INPUT)
-        search_input.fill("test")
-        
-        suggestions = page.locator(SEARCH.SUGGESTIONS_DROPDOWN)
-        try:
-            suggestions.wait_for(state="visible", timeout=5000)
-            post_btn = page.locator(SEARCH.SUGGEST_POST_BTN)
-            post_btn.click()
-            
-            # Should navigate to search results page
-            page.wait_for_url("**/search**", timeout=5000)
-            logger.info("✅ Navigated to search results page")
-        except Exception as e:
-            pytest.skip(f"Could not complete search flow: {e}")
+        ensure_at(page, BASE_UI)
+        
+        search = SearchPage(page)
+        search.search_input.fill("test")
+        
+        wait_after_action(page)
+        expect(search.suggestions).to_be_visible(timeout=2000)
+        
+        # Search results data arriving is the signal, not the URL change
+        with search.expect_search_response():
+            search.suggest_post_btn.click()
+        
+        assert "/search" in page.url, f"Should be on search results page, got {page.url}"
+        logger.info("✅ Navigated to search results page")
 
 
 @pytest.mark.ui  
@@ -153,16 +134,16 @@ class TestSearchEmptyState:
         
         # Navigate to search with random gibberish
         random_query = "xyzabc123nonsense987"
-        page.goto(f"{settings.urls.base_ui}/search?q={random_query}")
+        search = SearchPage(page)
+        search.open_results(random_query)
         
-        no_results = page.locator(SEARCH.NO_RESULTS_MESSAGE)
+        no_results = search.no_results_message
         
-        # May or may not show depending on implementation
-        try:
-            no_results.wait_for(state="visible", timeout=10000)
+        # May or may not show depending on implementation (informational - short probe)
+        if search.is_visible_slow(no_results, timeout=3000):
             expect(no_results).to_contain_text("Không tìm thấy kết quả nào")
             logger.info("✅ Empty state message displayed correctly")
-        except Exception:
+        else:
             logger.info("ℹ️ Empty state message not found - verify search page implementation")
 
 
@@ -176,9 +157,9 @@ class TestSearchButton:
         Test ID: SEARCH-030
         Verify search button is visible and clickable.
         """
-        page.goto(settings.urls.base_ui)
+        page.goto(BASE_UI)
         
-        search_btn = page.locator(SEARCH.SEARCH_BUTTON)
+        search_btn = SearchPage(page).search_button
         expect(search_btn).to_be_visible()
         expect(search_btn).to_be_enabled()
     
@@ -188,18 +169,14 @@ class TestSearchButton:
         Verify clicking search button with query triggers search.
         """
         page = logged_in_page
-        page.goto(settings.urls.base_ui)
+        ensure_at(page, BASE_UI)
         
-        search_input = page.locator(SEARCH.SEARCH_INPUT)
-        search_input.fill("test query")
+        search = SearchPage(page)
+        search.search_input.fill("test query")
         
-        search_btn = page.locator(SEARCH.SEARCH_BUTTON)
-        search_btn.click()
+        # Search API response is the signal that the search ran
+        with search.expect_search_response():
+            search.search_button.click()
         
-        # Should navigate to search page or show results
-        try:
-            page.wait_for_url("**/search**", timeout=5000)
-            logger.info("✅ Search triggered successfully")
-        except Exception:
-            # May use different URL pattern
-            logger.info("ℹ️ Search completed but URL pattern may differ")
+        assert "/search" in page.url, f"Should be on search results page, got {page.url}"
+        logger.info("✅ Search triggered successfully")
@@ -13,58 +13,189 @@ Usage:
     api = BlogAPIClient()
     api.auth.login(email="test@example.com", password="pass123")
     posts = api.posts.get_newsfeed()
+
+For test suites prefer `get_shared_client()`: one Session (and keep-alive
+pool) per base URL for the whole process. Switch users by swapping the
+Authorization header (`with_auth` / `clear_auth`), not by building new clients:
+
+    api = get_shared_client().with_auth(token)
+    ...
+    api.clear_auth()
 """
 
-from typing import Dict, Any, Optional
-from dataclasses import dataclass
+import functools
+import logging
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, Iterable, List, Optional, Sequence, Tuple
+import orjson
 from requests import Session, Response
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from config.settings import settings
 from core.logger import log
 
 logger = log()
 
+# Any key containing one of these (case-insensitive) is masked in debug logs
+# (covers password, accessToken, refreshToken, api_key, apiKey, ...)
+_SENSITIVE_KEY_RE = re.compile(r"pass|pwd|secret|token|key|credential", re.IGNORECASE)
 
-@dataclass
-class APIResponse:
-    """Standardized API response wrapper."""
-    status_code: int
-    data: Any
-    success: bool
-    raw_response: Response
+# Vote / react argument values
+VOTE_UP = "upvote"
+VOTE_DOWN = "downvote"
+TARGET_POST = "post"
+TARGET_COMMENT = "comment"
+# target_type -> backend `type` field
+_REACT_TYPES = {TARGET_POST: "POST", TARGET_COMMENT: "COMMENT"}
+_VOTE_TYPES = (VOTE_UP, VOTE_DOWN)
+# Pre-serialized vote body: only the IDs/type are formatted in per request
+_VOTE_TMPL = b'{"userId":%d,"postId":%d,"voteType":"%s"}'
+
+
+@functools.lru_cache(maxsize=256)
+def _join(base_slash: str, endpoint: str) -> str:
+    """Join `base/` and an endpoint (memoized - endpoints repeat across calls)."""
+    return base_slash + endpoint.lstrip("/")
 
+
+class APIResponse:
+    """
+    Standardized API response wrapper.
+    
+    The body is parsed lazily on first access of `data`/`json`, so callers
+    that only check `success`/`status_code` skip JSON decoding.
+    """
+    __slots__ = ("status_code", "success", "raw_response", "_data", "_parsed")
+    
+    def __init__(self, raw_response: Response):
+        self.raw_response = raw_response
+        self.status_code = raw_response.status_code
+        # status < 400 == requests' Response.ok (httpx responses have no .ok)
+        self.success = raw_response.status_code < 400
+        self._data: Any = None
+        self._parsed = False
+    
+    @property
+    def data(self) -> Any:
+        """Response body: parsed JSON, or raw text if not JSON."""
+        if not self._parsed:
+            try:
+                self._data = orjson.loads(self.raw_response.content)
+            except orjson.JSONDecodeError:
+                self._data = self.raw_response.text
+            self._parsed = True
+        return self._data
+    
     @property
     def json(self) -> Dict[str, Any]:
         """Get response as JSON dict."""
-        if isinstance(self.data, dict):
-            return self.data
+        data = self.data
+        if isinstance(data, dict):
+            return data
         return {}
+    
+    def __repr__(self) -> str:
+        return f"APIResponse(status_code={self.status_code}, success={self.success})"
 
 
 class BaseAPIClient:
-    """Base client with common HTTP methods."""
+    """
+    Base client with common HTTP methods.
+    
+    Backends (`backend` arg, default `settings.http_pool.BACKEND`):
+    - "requests": requests.Session, HTTP/1.1 keep-alive pool (default)
+    - "httpx-h2": httpx.Client with HTTP/2, multiplexing concurrent requests
+      over one connection (requires `pip install "httpx[http2]"`)
     
-    def __init__(self, base_url: str):
+    Body logging (LOG_API_BODIES=true) masks sensitive keys only for
+    _UNSAFE_ENDPOINTS. Other bodies are written to the log file as-is,
+    including user objects embedded in blog-posts/comments responses
+    (names, emails...), in exchange for skipping the masking walk.
+    """
+    # Endpoints whose bodies may carry credentials/tokens - only these are masked in body logs
+    _UNSAFE_ENDPOINTS = ("auth/", "saved-posts", "users/")
+    # Worker threads for map()/request_many() (<= settings.http_pool.POOL_MAXSIZE,
+    # so threads don't wait for connections)
+    MAP_MAX_WORKERS = 16
+    
+    def __init__(self, base_url: str, backend: Optional[str] = None):
         self.base_url = base_url.rstrip('/')
-        self.session = Session()
+        self._base_slash = self.base_url + "/"
+        self._timeout = settings.timeouts.API_REQUEST / 1000
+        self._log_bodies = settings.api_log.LOG_BODIES
+        self.backend = backend or settings.http_pool.BACKEND
+        # Worker threads for map()/request_many(), created on first use
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+        if self.backend == "httpx-h2":
+            self.session = self._create_httpx_client()
+        elif self.backend == "requests":
+            self.session = self._create_requests_session()
+        else:
+            raise ValueError(f"Unknown API backend: {self.backend!r}")
         self.session.headers.update({
             **settings.default_headers,
             "Content-Type": "application/json",
         })
     
+    def _create_requests_session(self) -> Session:
+        session = Session()
+        # Keep-alive pool sized for parallel tests (see settings.http_pool);
+        # only idempotent methods are retried, so a retried POST can't create duplicates
+        pool = settings.http_pool
+        retry = Retry(
+            total=pool.RETRY_TOTAL,
+            backoff_factor=pool.RETRY_BACKOFF,
+            status_forcelist=pool.RETRY_STATUSES,
+            allowed_methods=frozenset(["GET", "PUT", "DELETE", "HEAD", "OPTIONS"]),
+            # After the last retry return the 5xx response (success=False) instead of raising
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool.POOL_CONNECTIONS,
+            pool_maxsize=pool.POOL_MAXSIZE,
+            max_retries=retry,
+            pool_block=False
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+    
+    def _create_httpx_client(self):
+        # Optional dependency - only imported when the backend is selected
+        import httpx
+        
+        pool = settings.http_pool
+        limits = httpx.Limits(
+            max_connections=pool.POOL_MAXSIZE,
+            max_keepalive_connections=pool.POOL_CONNECTIONS
+        )
+        # httpx only retries failed connects (no status-based retry like urllib3)
+        transport = httpx.HTTPTransport(http2=True, limits=limits, retries=pool.RETRY_TOTAL)
+        return httpx.Client(transport=transport, timeout=self._timeout)
+    
+    def _send(self, method: str, url: str, **kwargs):
+        """Send one request through the configured backend."""
+        if self.backend == "httpx-h2" and 'data' in kwargs:
+            # httpx takes raw bytes bodies as `content=`
+            kwargs['content'] = kwargs.pop('data')
+        return self.session.request(method, url, **kwargs)
+    
     def _mask_sensitive_data(self, data: dict) -> dict:
         """Mask sensitive fields in request/response data for logging."""
         if not isinstance(data, dict):
             return data
         
-        sensitive_keys = ["password", "secret", "token", "accessToken", "refreshToken", 
-                         "key", "credential", "pass", "pwd", "api_key", "apiKey"]
-        
-        masked = data.copy()
-        for key in masked:
-            if any(sensitive in key.lower() for sensitive in sensitive_keys):
+        masked = {}
+        for key, value in data.items():
+            if _SENSITIVE_KEY_RE.search(key):
                 masked[key] = "********"
-            elif isinstance(masked[key], dict):
-                masked[key] = self._mask_sensitive_data(masked[key])
+            elif isinstance(value, dict):
+                masked[key] = self._mask_sensitive_data(value)
+            else:
+                masked[key] = value
         return masked
         
     def _request(
@@ -84,40 +215,40 @@ class BaseAPIClient:
         Returns:
             APIResponse object
         """
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        url = _join(self._base_slash, endpoint)
         
         # Set timeout if not provided
-        kwargs.setdefault('timeout', settings.timeouts.API_REQUEST / 1000)
+        kwargs.setdefault('timeout', self._timeout)
         
-        logger.info(f"🌐 {method} {url}")
+        logger.info("🌐 %s %s", method, url)
+        # Body logging parses + masks every body - opt-in via LOG_API_BODIES
+        # (core.logger always runs at DEBUG, so the level alone can't gate it)
+        debug = self._log_bodies and logger.isEnabledFor(logging.DEBUG)
+        # Known-safe endpoints (newsfeed, posts, comments, search...) skip masking
+        mask = debug and any(p in endpoint for p in self._UNSAFE_ENDPOINTS)
         if 'json' in kwargs:
-            # Mask sensitive fields before logging
-            log_body = self._mask_sensitive_data(kwargs['json'])
-            logger.debug(f"📤 Request Body: {log_body}")
+            # Encode with orjson (Content-Type: application/json is a session default)
+            payload = kwargs.pop('json')
+            kwargs['data'] = orjson.dumps(payload)
+            if debug:
+                # Mask sensitive fields before logging (on the original dict)
+                log_body = self._mask_sensitive_data(payload) if mask else payload
+                logger.debug("📤 Request Body: %s", log_body)
         
         try:
-            response = self.session.request(method, url, **kwargs)
-            
-            # Try to parse JSON
-            try:
-                data = response.json()
-            except Exception:
-                data = response.text
+            response = self._send(method, url, **kwargs)
+            api_response = APIResponse(response)
             
-            logger.info(f"✅ Response: {response.status_code}")
-            # Mask sensitive fields in response before logging
-            log_data = self._mask_sensitive_data(data) if isinstance(data, dict) else data
-            logger.debug(f"📥 Response Data: {log_data}")
+            logger.info("✅ Response: %s", response.status_code)
+            if debug:
+                # Mask sensitive fields in response before logging (parses the body)
+                log_data = self._mask_sensitive_data(api_response.data) if mask else api_response.data
+                logger.debug("📥 Response Data: %s", log_data)
             
-            return APIResponse(
-                status_code=response.status_code,
-                data=data,
-                success=response.ok,
-                raw_response=response
-            )
+            return api_response
             
         except Exception as e:
-            logger.error(f"❌ API Request Failed: {str(e)}")
+            logger.error("❌ API Request Failed: %s", e)
             raise
     
     def get(self, endpoint: str, **kwargs) -> APIResponse:
@@ -139,6 +270,58 @@ class BaseAPIClient:
     def delete(self, endpoint: str, **kwargs) -> APIResponse:
         """HTTP DELETE request."""
         return self._request("DELETE", endpoint, **kwargs)
+    
+    def request_many(self, calls: Sequence[Tuple]) -> List[APIResponse]:
+        """
+        Issue independent requests concurrently and return responses in order.
+        
+        Threads share the pooled keep-alive session, so N calls cost roughly
+        one round-trip window instead of N sequential ones.
+        
+        Args:
+            calls: Tuples of (method, endpoint) or (method, endpoint, kwargs)
+        
+        Usage:
+            feed, comments = api.request_many([
+                ("GET", "newsfeed", {"params": {"page": 1}}),
+                ("GET", "comments", {"params": {"postId": post_id}}),
+            ])
+        """
+        if not calls:
+            return []
+        
+        def send(call: Tuple) -> APIResponse:
+            method, endpoint, *rest = call
+            return self._request(method, endpoint, **(rest[0] if rest else {}))
+        
+        return self.map(send, calls)
+    
+    def map(self, fn: Callable[[Any], Any], items: Iterable[Any]) -> List[Any]:
+        """
+        Run `fn` over `items` on a reusable thread pool, results in input order.
+        
+        The pool (MAP_MAX_WORKERS threads) is created on first call and reused
+        until shutdown_pool(). Don't call map()/request_many() from inside `fn`
+        (nested waits on the same pool can deadlock).
+        
+        Usage:
+            responses = api.map(api.posts.create_post, post_payloads)
+        """
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.MAP_MAX_WORKERS,
+                    thread_name_prefix="api-client"
+                )
+            pool = self._pool
+        return list(pool.map(fn, items))
+    
+    def shutdown_pool(self):
+        """Stop the map() worker threads (a later map() starts a new pool)."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
 
 
 class AuthAPI:
@@ -173,7 +356,7 @@ class AuthAPI:
         })
         
         if response.success:
-            logger.info(f"🔐 Logged in as: {email_or_username}")
+            logger.info("🔐 Logged in as: %s", email_or_username)
             # Extract access token from response and set it in header
             data = response.json.get("data", {})
             access_token = data.get("accessToken")
@@ -230,6 +413,30 @@ class PostsAPI:
         """
         return self.client.post("blog-posts", json=post_data)
     
+    def create_posts(self, posts: List[Dict[str, Any]]) -> List[APIResponse]:
+        """
+        Create several posts concurrently (responses in input order).
+        
+        Backend has no batch route, so this fans out one POST per post over
+        the shared keep-alive pool (see BaseAPIClient.request_many).
+        """
+        return self.client.request_many([("POST", "blog-posts", {"json": post}) for post in posts])
+    
+    def bulk_seed(self, builders: List[Any], chunk_size: int = 50) -> List[APIResponse]:
+        """
+        Build and create posts from PostBuilders, dispatched in chunks.
+        
+        Usage:
+            api.posts.bulk_seed([PostBuilder().with_author(user_id).add_random_text_blocks(2)
+                                 for _ in range(100)])
+        """
+        payloads = [builder.build().to_dict() for builder in builders]
+        responses: List[APIResponse] = []
+        for start in range(0, len(payloads), chunk_size):
+            responses.extend(self.create_posts(payloads[start:start + chunk_size]))
+        logger.info("🌱 Seeded %d/%d posts", sum(r.success for r in responses), len(payloads))
+        return responses
+    
     def get_post(self, post_id: int, user_id: Optional[int] = None) -> APIResponse:
         """Get single post details."""
         params = {"userId": user_id} if user_id else {}
@@ -277,7 +484,7 @@ class VotesAPI:
         Cast or toggle vote.
         
         Args:
-            vote_type: "upvote" | "downvote"
+            vote_type: VOTE_UP ("upvote") | VOTE_DOWN ("downvote")
         """
         return self.client.post("votes", json={
             "userId": user_id,
@@ -285,6 +492,31 @@ class VotesAPI:
             "voteType": vote_type
         })
     
+    def prepare_vote_batch(self, entries: Sequence[Tuple[int, int, str]]) -> List[bytes]:
+        """
+        Serialize (user_id, post_id, vote_type) entries into request bodies
+        from a byte template (no JSON encoding per vote).
+        
+        IDs must be ints. vote_type must be VOTE_UP or VOTE_DOWN (it is
+        written into the JSON unescaped), anything else raises ValueError.
+        """
+        bodies = []
+        for user_id, post_id, vote_type in entries:
+            if vote_type not in _VOTE_TYPES:
+                raise ValueError(f"Invalid vote_type {vote_type!r}, expected one of {_VOTE_TYPES}")
+            bodies.append(_VOTE_TMPL % (user_id, post_id, vote_type.encode()))
+        return bodies
+    
+    def vote_many(self, entries: Sequence[Tuple[int, int, str]]) -> List[APIResponse]:
+        """
+        Cast several votes concurrently (responses in input order).
+        
+        Usage:
+            api.votes.vote_many([(user_id, post_id, VOTE_UP) for post_id in post_ids])
+        """
+        bodies = self.prepare_vote_batch(entries)
+        return self.client.request_many([("POST", "votes", {"data": body}) for body in bodies])
+    
     def get_vote_status(self, user_id: int, post_id: int) -> APIResponse:
         """Get user's current vote on a post."""
         return self.client.get(
@@ -320,6 +552,15 @@ class CommentsAPI:
             data["replyToUserId"] = reply_to_user_id
         return self.client.post("comments", json=data)
     
+    def create_comments(self, comments: List[Dict[str, Any]]) -> List[APIResponse]:
+        """
+        Create several comments concurrently (responses in input order).
+        
+        Args:
+            comments: API-ready dicts, e.g. from CommentBuilder().build().to_dict()
+        """
+        return self.client.request_many([("POST", "comments", {"json": comment}) for comment in comments])
+    
     def get_comments(
         self,
         post_id: int,
@@ -349,26 +590,26 @@ class ReactsAPI:
         user_id: int,
         target_id: int,
         emoji_id: int,
-        target_type: str = "post"
+        target_type: str = TARGET_POST
     ) -> APIResponse:
         """
         React with emoji.
         
         Args:
-            target_type: "post" | "comment"
+            target_type: TARGET_POST ("post") | TARGET_COMMENT ("comment")
         """
         return self.client.post("user-reacts", json={
             "userId": user_id,
-            "postId": target_id if target_type == "post" else None,
-            "commentId": target_id if target_type == "comment" else None,
+            "postId": target_id if target_type == TARGET_POST else None,
+            "commentId": target_id if target_type == TARGET_COMMENT else None,
             "emojiId": emoji_id,
-            "type": target_type.upper()
+            "type": _REACT_TYPES.get(target_type) or target_type.upper()
         })
     
-    def get_reacts(self, target_id: int, target_type: str = "post") -> APIResponse:
+    def get_reacts(self, target_id: int, target_type: str = TARGET_POST) -> APIResponse:
         """Get all reactions for post/comment."""
         return self.client.get("user-reacts", params={
-            "postId" if target_type == "post" else "commentId": target_id
+            "postId" if target_type == TARGET_POST else "commentId": target_id
         })
 
 
@@ -455,8 +696,8 @@ class BlogAPIClient(BaseAPIClient):
         posts = api.posts.get_newsfeed()
     """
     
-    def __init__(self, base_url: Optional[str] = None):
-        super().__init__(base_url or settings.urls.base_api)
+    def __init__(self, base_url: Optional[str] = None, backend: Optional[str] = None):
+        super().__init__(base_url or settings.urls.base_api, backend)
         
         # Initialize domain-specific API handlers
         self.auth = AuthAPI(self)
@@ -468,13 +709,38 @@ class BlogAPIClient(BaseAPIClient):
         self.saved_posts = SavedPostsAPI(self)
         self.search = SearchAPI(self)
         
-        logger.info(f"🔧 Blog API Client initialized: {self.base_url}")
+        logger.info("🔧 Blog API Client initialized: %s", self.base_url)
     
     def get_cookies(self) -> Dict[str, str]:
         """Extract cookies from session (useful for Playwright context injection)."""
-        return {cookie.name: cookie.value for cookie in self.session.cookies}
+        return {name: value for name, value in self.session.cookies.items()}
     
     def clear_session(self):
-        """Clear all cookies and auth state."""
+        """Clear all cookies and auth state, and stop the map() worker threads."""
         self.session.cookies.clear()
+        self.shutdown_pool()
         logger.info("🧹 Session cleared")
+    
+    def with_auth(self, token: str) -> 'BlogAPIClient':
+        """Authenticate subsequent requests with `token` (returns self for chaining)."""
+        self.session.headers["Authorization"] = f"Bearer {token}"
+        return self
+    
+    def clear_auth(self):
+        """Drop the Authorization header (session and pool are kept)."""
+        self.session.headers.pop("Authorization", None)
+
+
+@functools.lru_cache(maxsize=8)
+def _shared_client(base_url: str) -> BlogAPIClient:
+    return BlogAPIClient(base_url)
+
+
+def get_shared_client(base_url: Optional[str] = None) -> BlogAPIClient:
+    """
+    Process-wide BlogAPIClient for `base_url` (default: settings API URL).
+    
+    Repeated calls return the same client, so every caller shares one
+    Session and connection pool.
+    """
+    return _shared_client((base_url or settings.urls.base_api).rstrip('/'))
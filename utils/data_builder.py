@@ -11,15 +11,73 @@ Usage:
     post_data = PostBuilder().with_title("My Post").build()
 """
 
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass, field, asdict
+from typing import Dict, Any, List, Optional, Sequence
+from dataclasses import dataclass, field
 from faker import Faker
 from enum import Enum
+import itertools
+import os
 import random
 
 fake = Faker()
 
 
+# ============================================
+# FAKE DATA POOLS
+# ============================================
+
+# Faker tốn nhiều CPU mỗi lần gọi (provider dispatch, locale...), nên sinh sẵn
+# một pool cho mỗi loại rồi bốc ngẫu nhiên. Pool được tạo lười ở lần dùng đầu
+# tiên để import module (vd. chỉ dùng enum) không phải trả chi phí khởi tạo.
+_POOL_FACTORIES = {
+    "email": (fake.email, 4096),
+    "name": (fake.name, 4096),
+    "paragraph": (fake.paragraph, 2048),
+    "image_url": (fake.image_url, 512),
+    "sentence": (lambda: fake.sentence(nb_words=10), 2048),
+    "title": (lambda: fake.sentence(nb_words=6).rstrip('.'), 2048),
+    "word": (fake.word, 10000),
+}
+_pools: Dict[str, List[str]] = {}
+_email_seq = itertools.count()
+
+
+def _pool(kind: str) -> List[str]:
+    """Return the pre-generated pool for `kind`, building it on first use."""
+    pool = _pools.get(kind)
+    if pool is None:
+        factory, size = _POOL_FACTORIES[kind]
+        pool = _pools[kind] = [factory() for _ in range(size)]
+    return pool
+
+
+def _fake(kind: str) -> str:
+    """Random value from the `kind` pool."""
+    pool = _pool(kind)
+    return pool[random.randrange(len(pool))]
+
+
+def _unique_email() -> str:
+    """
+    Pool email made unique with a `.<worker><n>` local-part suffix (pool
+    values repeat, but registration needs a fresh address every time).
+    Plain local part, no plus-addressing the backend might reject.
+    """
+    local, domain = _fake("email").split("@", 1)
+    worker = os.getenv("PYTEST_XDIST_WORKER", "")
+    return f"{local}.{worker}{next(_email_seq)}@{domain}"
+
+
+def _random_title() -> str:
+    """
+    Random post title, tagged with the pytest-xdist worker id when running
+    in parallel so workers never create posts with colliding titles.
+    """
+    title = _fake("title")
+    worker = os.getenv("PYTEST_XDIST_WORKER", "")
+    return f"{title} [{worker}]" if worker else title
+
+
 class BlogPostType(Enum):
     """Blog post types matching backend enum."""
     PERSONAL = "PERSONAL"
@@ -36,7 +94,17 @@ class BlockType(Enum):
     QUOTE = "QUOTE"
 
 
-@dataclass
+# Enum values cached as plain strings (builders set them on every call)
+TEXT_T = BlockType.TEXT.value
+IMAGE_T = BlockType.IMAGE.value
+CODE_T = BlockType.CODE.value
+QUOTE_T = BlockType.QUOTE.value
+PERSONAL_T = BlogPostType.PERSONAL.value
+COMMUNITY_T = BlogPostType.COMMUNITY.value
+REPOST_T = BlogPostType.REPOST.value
+
+
+@dataclass(slots=True)
 class UserData:
     """User registration/profile data."""
     email: str
@@ -47,10 +115,16 @@ class UserData:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dict, excluding None values."""
-        return {k: v for k, v in asdict(self).items() if v is not None}
+        return {
+            "email": self.email,
+            "name": self.name,
+            "password": self.password,
+            **({"bio": self.bio} if self.bio is not None else {}),
+            **({"gender": self.gender} if self.gender is not None else {}),
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class BlockData:
     """Content block data."""
     type: str
@@ -63,28 +137,30 @@ class BlockData:
     object_fit: Optional[str] = None
     
     def to_dict(self) -> Dict[str, Any]:
-        result = {
+        return {
             "type": self.type,
             "content": self.content,
             "x": self.x,
             "y": self.y,
             "width": self.width,
-            "height": self.height
+            "height": self.height,
+            **({"imageCaption": self.image_caption} if self.image_caption else {}),
+            **({"objectFit": self.object_fit} if self.object_fit else {}),
         }
-        if self.image_caption:
-            result["imageCaption"] = self.image_caption
-        if self.object_fit:
-            result["objectFit"] = self.object_fit
-        return result
 
 
-@dataclass
+@dataclass(slots=True)
 class PostData:
-    """Blog post creation data."""
+    """
+    Blog post creation data.
+    
+    Immutable once built: `blocks` is frozen into a tuple by PostBuilder.build()
+    and `to_dict` hands that same tuple out (no copy per call).
+    """
     title: str
     type: str
     author_id: int
-    blocks: List[Dict[str, Any]] = field(default_factory=list)
+    blocks: Sequence[Dict[str, Any]] = field(default_factory=list)
     community_id: Optional[int] = None
     original_post_id: Optional[int] = None  # For reposts
     hashtag_ids: List[int] = field(default_factory=list)
@@ -92,26 +168,19 @@ class PostData:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to API-ready dict."""
-        data = {
+        return {
             "title": self.title,
             "type": self.type,
             "authorId": self.author_id,
             "blocks": self.blocks,
+            **({"communityId": self.community_id} if self.community_id else {}),
+            **({"originalPostId": self.original_post_id} if self.original_post_id else {}),
+            **({"hashtagIds": self.hashtag_ids} if self.hashtag_ids else {}),
+            **({"thumbnailUrl": self.thumbnail_url} if self.thumbnail_url else {}),
         }
-        
-        if self.community_id:
-            data["communityId"] = self.community_id
-        if self.original_post_id:
-            data["originalPostId"] = self.original_post_id
-        if self.hashtag_ids:
-            data["hashtagIds"] = self.hashtag_ids
-        if self.thumbnail_url:
-            data["thumbnailUrl"] = self.thumbnail_url
-            
-        return data
-
-
-@dataclass
+
+
+@dataclass(slots=True)
 class CommentData:
     """Comment creation data."""
     post_id: int
@@ -123,19 +192,15 @@ class CommentData:
     block_id: Optional[int] = None  # For BLOCK type comments
     
     def to_dict(self) -> Dict[str, Any]:
-        data = {
+        return {
             "postId": self.post_id,
             "commenterId": self.commenter_id,
             "content": self.content,
             "type": self.comment_type,
+            **({"parentCommentId": self.parent_comment_id} if self.parent_comment_id else {}),
+            **({"replyToUserId": self.reply_to_user_id} if self.reply_to_user_id else {}),
+            **({"blockId": self.block_id} if self.block_id and self.comment_type == "BLOCK" else {}),
         }
-        if self.parent_comment_id:
-            data["parentCommentId"] = self.parent_comment_id
-        if self.reply_to_user_id:
-            data["replyToUserId"] = self.reply_to_user_id
-        if self.block_id and self.comment_type == "BLOCK":
-            data["blockId"] = self.block_id
-        return data
 
 
 # ============================================
@@ -168,7 +233,7 @@ class UserBuilder:
     
     def with_random_email(self) -> 'UserBuilder':
         """Generate random email."""
-        self._data.email = fake.email()
+        self._data.email = _unique_email()
         return self
     
     def with_name(self, name: str) -> 'UserBuilder':
@@ -178,7 +243,7 @@ class UserBuilder:
     
     def with_random_name(self) -> 'UserBuilder':
         """Generate random full name."""
-        self._data.name = fake.name()
+        self._data.name = _fake("name")
         return self
     
     def with_password(self, password: str) -> 'UserBuilder':
@@ -215,9 +280,9 @@ class UserBuilder:
         """Build and return UserData object."""
         # Auto-generate missing required fields
         if not self._data.email:
-            self._data.email = fake.email()
+            self._data.email = _unique_email()
         if not self._data.name:
-            self._data.name = fake.name()  # Generate full name
+            self._data.name = _fake("name")  # Generate full name
         
         return self._data
 
@@ -237,7 +302,7 @@ class BlockBuilder:
     
     def __init__(self):
         self._data = BlockData(
-            type=BlockType.TEXT.value,
+            type=TEXT_T,
             content="",
             x=0,
             y=0,
@@ -247,22 +312,22 @@ class BlockBuilder:
     
     def as_text(self) -> 'BlockBuilder':
         """Set block type as TEXT."""
-        self._data.type = BlockType.TEXT.value
+        self._data.type = TEXT_T
         return self
     
     def as_image(self) -> 'BlockBuilder':
         """Set block type as IMAGE."""
-        self._data.type = BlockType.IMAGE.value
+        self._data.type = IMAGE_T
         return self
     
     def as_code(self) -> 'BlockBuilder':
         """Set block type as CODE."""
-        self._data.type = BlockType.CODE.value
+        self._data.type = CODE_T
         return self
     
     def as_quote(self) -> 'BlockBuilder':
         """Set block type as QUOTE."""
-        self._data.type = BlockType.QUOTE.value
+        self._data.type = QUOTE_T
         return self
     
     def with_content(self, content: str) -> 'BlockBuilder':
@@ -272,12 +337,12 @@ class BlockBuilder:
     
     def with_random_text(self, paragraphs: int = 1) -> 'BlockBuilder':
         """Generate random text content."""
-        self._data.content = fake.paragraph()
+        self._data.content = _fake("paragraph")
         return self
     
     def with_random_image_url(self) -> 'BlockBuilder':
         """Generate random image URL."""
-        self._data.content = fake.image_url()
+        self._data.content = _fake("image_url")
         return self
     
     def at_position(self, x: int = 0, y: int = 0) -> 'BlockBuilder':
@@ -296,11 +361,11 @@ class BlockBuilder:
         """Build and return block as dict."""
         if not self._data.content:
             # Auto-generate content based on type
-            if self._data.type == BlockType.TEXT.value:
-                self._data.content = fake.paragraph()
-            elif self._data.type == BlockType.IMAGE.value:
-                self._data.content = fake.image_url()
-            elif self._data.type == BlockType.CODE.value:
+            if self._data.type == TEXT_T:
+                self._data.content = _fake("paragraph")
+            elif self._data.type == IMAGE_T:
+                self._data.content = _fake("image_url")
+            elif self._data.type == CODE_T:
                 self._data.content = "print('Hello World')"
         
         return self._data.to_dict()
@@ -322,7 +387,7 @@ class PostBuilder:
     def __init__(self):
         self._data = PostData(
             title="",
-            type=BlogPostType.PERSONAL.value,
+            type=PERSONAL_T,
             author_id=0,
             blocks=[]
         )
@@ -339,51 +404,79 @@ class PostBuilder:
     
     def with_random_title(self) -> 'PostBuilder':
         """Generate random title."""
-        self._data.title = fake.sentence(nb_words=6).rstrip('.')
+        self._data.title = _random_title()
         return self
     
     def as_personal(self) -> 'PostBuilder':
         """Set post type as PERSONAL."""
-        self._data.type = BlogPostType.PERSONAL.value
+        self._data.type = PERSONAL_T
         return self
     
     def as_community(self, community_id: int) -> 'PostBuilder':
         """Set post type as COMMUNITY."""
-        self._data.type = BlogPostType.COMMUNITY.value
+        self._data.type = COMMUNITY_T
         self._data.community_id = community_id
         return self
     
     def as_repost(self, original_post_id: int) -> 'PostBuilder':
         """Set post type as REPOST."""
-        self._data.type = BlogPostType.REPOST.value
+        self._data.type = REPOST_T
         self._data.original_post_id = original_post_id
         return self
     
+    def with_blocks(self, blocks: Sequence[Dict[str, Any]]) -> 'PostBuilder':
+        """
+        Reuse already-built blocks by reference, e.g. for repost variants:
+            PostBuilder().with_blocks(post.blocks).as_repost(post_id).build()
+        """
+        self._data.blocks = blocks
+        return self
+    
+    def _block_list(self) -> List[Dict[str, Any]]:
+        """Mutable block list (copies a shared tuple only if blocks are added)."""
+        if isinstance(self._data.blocks, tuple):
+            self._data.blocks = list(self._data.blocks)
+        return self._data.blocks
+    
     def add_block(self, block: Dict[str, Any]) -> 'PostBuilder':
         """Add a content block."""
-        self._data.blocks.append(block)
+        self._block_list().append(block)
         return self
     
     def add_text_block(self, content: str, y: int = None) -> 'PostBuilder':
         """Quick add text block."""
         block_y = y if y is not None else len(self._data.blocks) * 100
         block = BlockBuilder().as_text().with_content(content).at_position(0, block_y).with_size(12, 100).build()
-        self._data.blocks.append(block)
+        self._block_list().append(block)
         return self
     
     def add_random_text_blocks(self, count: int = 3) -> 'PostBuilder':
         """Add multiple random text blocks."""
-        for i in range(count):
-            block_y = len(self._data.blocks) * 100
-            block = BlockBuilder().as_text().with_random_text().at_position(0, block_y).with_size(12, 100).build()
-            self._data.blocks.append(block)
+        # Dựng dict trực tiếp thay vì chain BlockBuilder cho từng block
+        base = len(self._data.blocks)
+        paragraphs = _pool("paragraph")
+        if count <= len(paragraphs):
+            contents = random.sample(paragraphs, count)
+        else:
+            contents = random.choices(paragraphs, k=count)
+        self._block_list().extend(
+            {
+                "type": TEXT_T,
+                "content": content,
+                "x": 0,
+                "y": (base + i) * 100,
+                "width": 12,
+                "height": 100,
+            }
+            for i, content in enumerate(contents)
+        )
         return self
     
     def add_image_block(self, image_url: str, y: int = None) -> 'PostBuilder':
         """Quick add image block."""
         block_y = y if y is not None else len(self._data.blocks) * 100
         block = BlockBuilder().as_image().with_content(image_url).at_position(0, block_y).with_size(12, 200).build()
-        self._data.blocks.append(block)
+        self._block_list().append(block)
         return self
     
     def with_hashtags(self, hashtag_ids: List[int]) -> 'PostBuilder':
@@ -400,10 +493,12 @@ class PostBuilder:
         """Build and return PostData object."""
         # Auto-generate missing required fields
         if not self._data.title:
-            self._data.title = fake.sentence(nb_words=6).rstrip('.')
+            self._data.title = _random_title()
         if not self._data.blocks:
             # Add at least one text block
             self.add_random_text_blocks(1)
+        # Freeze: post data is immutable after build, blocks are shared as-is
+        self._data.blocks = tuple(self._data.blocks)
         
         return self._data
 
@@ -449,7 +544,7 @@ class CommentBuilder:
     
     def with_random_content(self) -> 'CommentBuilder':
         """Generate random comment."""
-        self._data.content = fake.sentence(nb_words=random.randint(5, 15))
+        self._data.content = _fake("sentence")
         return self
     
     def as_reply_to(self, parent_comment_id: int, reply_to_user_id: int = None) -> 'CommentBuilder':
@@ -462,9 +557,28 @@ class CommentBuilder:
     def build(self) -> CommentData:
         """Build and return CommentData object."""
         if not self._data.content:
-            self._data.content = fake.sentence()
+            self._data.content = _fake("sentence")
         
         return self._data
+    
+    @classmethod
+    def bulk_random(cls, n: int, post_id: int, commenter_id: int) -> List[CommentData]:
+        """
+        Build `n` random comments in one pass (for large comment seeds).
+        
+        Word counts (5-15) are drawn in a single batch and sentences are
+        composed from the word pool, without a Faker call per comment.
+        """
+        words = _pool("word")
+        word_counts = random.choices(range(5, 16), k=n)
+        return [
+            CommentData(
+                post_id=post_id,
+                commenter_id=commenter_id,
+                content=" ".join(random.sample(words, k)).capitalize() + ".",
+            )
+            for k in word_counts
+        ]
 
 
 # ============================================